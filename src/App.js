@@ -1,15 +1,34 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useMemo, useRef, lazy, Suspense } from 'react';
 import { toast, ToastContainer } from 'react-toastify';
 import 'react-toastify/dist/ReactToastify.css';
 
 // Utils
 import { readExcelFile, exportDomainCategorization, exportSimilarityAnalysis, exportCombinedReports, createSampleExcelFile } from './utils/excelUtils';
-import { TFIDFVectorizer, cosineSimilarity, categorizeByKeywords, generateSimilarityExplanation, getSimilarityLevel } from './utils/textProcessing';
+import { TFIDFVectorizer, findSimilarPairs, findCandidatePairs, categorizeByKeywords, generateSimilarityExplanation, createTextProfile, getSimilarityLevel, countUniqueDomains, SIMILARITY_THRESHOLD, SIMILARITY_CANDIDATES_PER_PROJECT, TFIDF_OPTIONS } from './utils/textProcessing';
 import { initializeGemini, isGeminiAvailable, batchCategorizeWithGemini, batchAnalyzeSimilarityWithGemini } from './utils/geminiApi';
 
-// Components
-import PanelAllocation from './components/PanelAllocation';
-import ConstraintBasedPanelAllocation from './components/ConstraintBasedPanelAllocation';
+// Components (loaded on first use to keep the initial bundle small)
+const PanelAllocation = lazy(() => import('./components/PanelAllocation'));
+const ConstraintBasedPanelAllocation = lazy(() => import('./components/ConstraintBasedPanelAllocation'));
+
+// Rows shown in the on-screen result tables; downloads contain everything
+const RESULTS_PREVIEW_ROWS = 10;
+
+// Short "Specific Reasons" cell text: the first two ✓ reasons of an explanation
+const summarizeReasons = (explanation) => {
+  const reasons = explanation.split('\n')
+    .map(line => line.trim())
+    .filter(line => line.startsWith('✓'));
+  return reasons.length > 0
+    ? reasons.slice(0, 2).map(reason => reason.substring(2)).join('; ') + (reasons.length > 2 ? '...' : '')
+    : explanation.substring(0, 100) + '...';
+};
+
+// Projects processed between progress updates in the synchronous stages
+const PROGRESS_BATCH_SIZE = 50;
+
+// Let React paint pending progress updates before the next chunk of work
+const yieldToBrowser = () => new Promise(resolve => setTimeout(resolve, 0));
 
 function App() {
   // State management
@@ -29,6 +48,20 @@ function App() {
   // Removed unused state variable panelAllocationResult
   const [showConstraintAllocation, setShowConstraintAllocation] = useState(false);
   const [useGeminiForSimilarity, setUseGeminiForSimilarity] = useState(false);
+  // Last completed analysis and the inputs it was run with
+  const analysisCacheRef = useRef(null);
+
+  // Derived from the results only, so typing in the settings panel does not
+  // recount domains or re-slice the result tables
+  const uniqueDomainCount = useMemo(() => countUniqueDomains(domainResults), [domainResults]);
+  const domainPreviewRows = useMemo(() => domainResults.slice(0, RESULTS_PREVIEW_ROWS), [domainResults]);
+  const similarityPreviewRows = useMemo(
+    () => similarityResults.slice(0, RESULTS_PREVIEW_ROWS).map(pair => ({
+      ...pair,
+      reasonSummary: summarizeReasons(pair.explanation)
+    })),
+    [similarityResults]
+  );
 
   // Handle file upload
   const handleFileUpload = useCallback(async (file) => {
@@ -81,6 +114,30 @@ function App() {
       return;
     }
 
+    // Re-running on the same loaded data with the same settings reuses the
+    // previous results instead of analyzing everything again
+    const geminiEnabled = useGemini && isGeminiAvailable();
+    const cached = analysisCacheRef.current;
+    if (
+      cached &&
+      cached.projectsData === projectsData &&
+      cached.geminiEnabled === geminiEnabled &&
+      cached.geminiApiKey === geminiApiKey &&
+      cached.useGeminiForSimilarity === useGeminiForSimilarity
+    ) {
+      // Leave the same state a finished run does, so no stale error banner
+      // or progress shows next to the reused results
+      setError(null);
+      setCurrentStep(0);
+      setCurrentProject(0);
+      setAnalysisStatus('');
+      setIsAnalyzing(false);
+      setDomainResults(cached.domainResults);
+      setSimilarityResults(cached.similarityResults);
+      toast.info('Inputs unchanged, showing the previous analysis results');
+      return;
+    }
+
     setIsAnalyzing(true);
     setError(null);
     setCurrentProject(0);
@@ -91,8 +148,10 @@ function App() {
       setAnalysisStatus('Categorizing projects by domains...');
       
       const domainResults = [];
+      // Set when a Gemini step fell back, so the run is retried rather than cached
+      let usedFallback = false;
       
-      if (useGemini && isGeminiAvailable()) {
+      if (geminiEnabled) {
         // Use Gemini AI for categorization
         setAnalysisStatus('Using Gemini AI for intelligent categorization...');
         
@@ -110,7 +169,26 @@ function App() {
 
           if (result.result.success) {
             const geminiData = result.result.data;
-            const domains = geminiData.domains.map(d => d.name);
+            
+            // Collect unique domain names, confidence details and the top
+            // score in a single pass over the returned domains
+            const domains = [];
+            const seenDomains = new Set();
+            const confidenceScores = {};
+            let maxConfidenceScore = -Infinity;
+            
+            geminiData.domains.forEach(d => {
+              if (!seenDomains.has(d.name)) {
+                seenDomains.add(d.name);
+                domains.push(d.name);
+              }
+              confidenceScores[d.name] = {
+                score: d.confidence,
+                reasoning: d.reasoning,
+                method: 'gemini_ai'
+              };
+              maxConfidenceScore = Math.max(maxConfidenceScore, d.confidence);
+            });
             
             projectResult = {
               projectId: project.projectId,
@@ -118,19 +196,13 @@ function App() {
               projectScope: project.projectScope,
               domains: domains,
               primaryDomain: geminiData.primary_domain || domains[0],
-              confidenceScores: geminiData.domains.reduce((acc, d) => {
-                acc[d.name] = {
-                  score: d.confidence,
-                  reasoning: d.reasoning,
-                  method: 'gemini_ai'
-                };
-                return acc;
-              }, {}),
+              confidenceScores,
               categorizationMethod: 'gemini_ai',
-              maxConfidenceScore: Math.max(...geminiData.domains.map(d => d.confidence))
+              maxConfidenceScore
             };
           } else {
             // Fallback to keyword matching
+            usedFallback = true;
             const keywordResult = categorizeByKeywords(project.projectTitle, project.projectScope);
             projectResult = {
               projectId: project.projectId,
@@ -150,9 +222,13 @@ function App() {
         // Use keyword-based categorization
         setAnalysisStatus('Using keyword-based categorization...');
         
-        projectsData.forEach((project, index) => {
-          setCurrentProject(index + 1);
-          setAnalysisStatus(`Categorizing project ${index + 1}/${projectsData.length}: ${project.projectId}`);
+        for (let index = 0; index < projectsData.length; index++) {
+          const project = projectsData[index];
+          if (index % PROGRESS_BATCH_SIZE === 0) {
+            setCurrentProject(index + 1);
+            setAnalysisStatus(`Categorizing project ${index + 1}/${projectsData.length}: ${project.projectId}`);
+            await yieldToBrowser();
+          }
           
           const result = categorizeByKeywords(project.projectTitle, project.projectScope);
           
@@ -166,7 +242,8 @@ function App() {
             categorizationMethod: 'keyword_matching',
             maxConfidenceScore: Math.max(...Object.values(result.confidenceScores).map(c => c.score))
           });
-        });
+        }
+        setCurrentProject(projectsData.length);
       }
 
       setDomainResults(domainResults);
@@ -174,19 +251,28 @@ function App() {
       // Step 3: Similarity Analysis
       setCurrentStep(3);
       setAnalysisStatus('Calculating project similarities...');
+      await yieldToBrowser();
       
       let similarityResults = [];
       
-      if (useGemini && isGeminiAvailable() && useGeminiForSimilarity) {
+      // TF-IDF vectors pick the Gemini candidates and drive the TF-IDF analysis
+      const texts = projectsData.map(p => `${p.projectTitle} ${p.projectScope}`);
+      const vectorizer = new TFIDFVectorizer(TFIDF_OPTIONS);
+      const tfidfVectors = vectorizer.fitTransformSparse(texts);
+      
+      if (geminiEnabled && useGeminiForSimilarity) {
         // Use Gemini AI for enhanced similarity analysis
         setAnalysisStatus('Using Gemini AI for advanced similarity analysis...');
         
         try {
+          // Only send each project's nearest TF-IDF neighbours to Gemini
+          // rather than every possible pair
           similarityResults = await batchAnalyzeSimilarityWithGemini(
             domainResults,
             (current, total, comparison) => {
               setAnalysisStatus(`Analyzing similarities ${current}/${total}: ${comparison}`);
-            }
+            },
+            findCandidatePairs(tfidfVectors, SIMILARITY_CANDIDATES_PER_PROJECT)
           );
         } catch (error) {
           console.error('Gemini similarity analysis failed, falling back to TF-IDF:', error);
@@ -198,44 +284,60 @@ function App() {
       if (!useGeminiForSimilarity || similarityResults.length === 0) {
         // Use traditional TF-IDF analysis
         setAnalysisStatus('Using TF-IDF similarity analysis...');
+        if (geminiEnabled && useGeminiForSimilarity) {
+          usedFallback = true;
+        }
         
-        const texts = projectsData.map(p => `${p.projectTitle} ${p.projectScope}`);
-        const vectorizer = new TFIDFVectorizer({ maxFeatures: 1000, minDf: 1, maxDf: 0.95 });
-        const tfidfVectors = vectorizer.fitTransform(texts);
+        // Filter to the surviving pairs first, then build records only for those
+        const similarPairs = findSimilarPairs(tfidfVectors, SIMILARITY_THRESHOLD);
         
-        const threshold = 0.3;
+        // Domain sets and text profiles built once per project, not per compared
+        // pair; profiles only for projects that appear in a similar pair
+        const domainSets = domainResults.map(p => new Set(p.domains));
+        const textProfiles = new Array(texts.length);
+        const getTextProfile = index => {
+          if (!textProfiles[index]) {
+            textProfiles[index] = createTextProfile(texts[index]);
+          }
+          return textProfiles[index];
+        };
         
-        for (let i = 0; i < tfidfVectors.length; i++) {
-          for (let j = i + 1; j < tfidfVectors.length; j++) {
-            const similarity = cosineSimilarity(tfidfVectors[i], tfidfVectors[j]);
-            
-            if (similarity > threshold) {
-              const project1 = domainResults[i];
-              const project2 = domainResults[j];
-              
-              const overlappingDomains = project1.domains.filter(d => project2.domains.includes(d));
-              const similarityLevel = getSimilarityLevel(similarity);
-              
-              const explanation = generateSimilarityExplanation(
-                project1.projectId,
-                project2.projectId,
-                similarity,
-                overlappingDomains,
-                texts[i],
-                texts[j]
-              );
-              
-              similarityResults.push({
-                project1Id: project1.projectId,
-                project2Id: project2.projectId,
-                similarityScore: similarity,
-                similarityLevel,
-                overlappingDomains,
-                explanation,
-                analysisMethod: 'tfidf'
-              });
-            }
+        similarityResults = new Array(similarPairs.count);
+        
+        for (let k = 0; k < similarPairs.count; k++) {
+          if (k % PROGRESS_BATCH_SIZE === 0) {
+            setAnalysisStatus(`Explaining similar pairs ${k + 1}/${similarPairs.count}`);
+            await yieldToBrowser();
           }
+          
+          const index1 = similarPairs.index1[k];
+          const index2 = similarPairs.index2[k];
+          const score = similarPairs.scores[k];
+          const project1 = domainResults[index1];
+          const project2 = domainResults[index2];
+          
+          const overlappingDomains = project1.domains.filter(d => domainSets[index2].has(d));
+          
+          const explanation = generateSimilarityExplanation(
+            project1.projectId,
+            project2.projectId,
+            score,
+            overlappingDomains,
+            getTextProfile(index1),
+            getTextProfile(index2)
+          );
+          
+          similarityResults[k] = {
+            project1Id: project1.projectId,
+            project2Id: project2.projectId,
+            similarityScore: score,
+            similarityLevel: getSimilarityLevel(score),
+            overlappingDomains,
+            // Joined once here; the tables and reports show this text per row
+            overlappingDomainsText: overlappingDomains.join(', '),
+            explanation,
+            analysisMethod: 'tfidf'
+          };
         }
         
         // Sort by similarity score (descending)
@@ -243,6 +345,14 @@ function App() {
       }
       
       setSimilarityResults(similarityResults);
+      analysisCacheRef.current = usedFallback ? null : {
+        projectsData,
+        geminiEnabled,
+        geminiApiKey,
+        useGeminiForSimilarity,
+        domainResults,
+        similarityResults
+      };
       
       // Step 4: Complete
       setCurrentStep(4);
@@ -264,7 +374,7 @@ function App() {
       setAnalysisStatus('');
       toast.error(`Analysis failed: ${err.message}`);
     }
-  }, [projectsData, useGemini, useGeminiForSimilarity]);
+  }, [projectsData, useGemini, useGeminiForSimilarity, geminiApiKey]);
 
   // Download handlers
   const handleDownloadDomains = useCallback(() => {
@@ -411,7 +521,12 @@ function App() {
                 <input
                   type="file"
                   accept=".xlsx,.xls,.csv"
-                  onChange={(e) => e.target.files[0] && handleFileUpload(e.target.files[0])}
+                  onChange={(e) => {
+                    const file = e.target.files[0];
+                    // Clear the input so picking the same file again still fires onChange
+                    e.target.value = '';
+                    if (file) handleFileUpload(file);
+                  }}
                   className="file-input"
                 />
               </div>
@@ -580,9 +695,7 @@ function App() {
                 </div>
                 <div className="summary-card">
                   <h4>Unique Domains</h4>
-                  <p className="summary-number">
-                    {new Set(domainResults.flatMap(p => Array.isArray(p.domains) ? p.domains : [p.domains])).size}
-                  </p>
+                  <p className="summary-number">{uniqueDomainCount}</p>
                 </div>
                 <div className="summary-card">
                   <h4>Similar Pairs</h4>
@@ -603,7 +716,7 @@ function App() {
                       </tr>
                     </thead>
                     <tbody>
-                      {domainResults.slice(0, 10).map((project, index) => (
+                      {domainPreviewRows.map((project, index) => (
                         <tr key={index}>
                           <td>{project.projectId}</td>
                           <td>{project.projectTitle}</td>
@@ -617,9 +730,9 @@ function App() {
                       ))}
                     </tbody>
                   </table>
-                  {domainResults.length > 10 && (
+                  {domainResults.length > RESULTS_PREVIEW_ROWS && (
                     <p className="table-note">
-                      Showing first 10 results. Download the complete report for all {domainResults.length} projects.
+                      Showing first {RESULTS_PREVIEW_ROWS} results. Download the complete report for all {domainResults.length} projects.
                     </p>
                   )}
                 </div>
@@ -642,7 +755,7 @@ function App() {
                         </tr>
                       </thead>
                       <tbody>
-                        {similarityResults.slice(0, 10).map((pair, index) => (
+                        {similarityPreviewRows.map((pair, index) => (
                           <tr key={index}>
                             <td>{pair.project1Id}</td>
                             <td>{pair.project2Id}</td>
@@ -658,22 +771,15 @@ function App() {
                               </span>
                             </td>
                             <td title={pair.explanation}>
-                              {/* Extract and show first few specific reasons */}
-                              {(() => {
-                                const lines = pair.explanation.split('\n');
-                                const reasons = lines.filter(line => line.trim().startsWith('✓')).slice(0, 2);
-                                return reasons.length > 0
-                                  ? reasons.map(reason => reason.trim().substring(2)).join('; ') + (lines.filter(line => line.trim().startsWith('✓')).length > 2 ? '...' : '')
-                                  : pair.explanation.substring(0, 100) + '...';
-                              })()}
+                              {pair.reasonSummary}
                             </td>
                           </tr>
                         ))}
                       </tbody>
                     </table>
-                    {similarityResults.length > 10 && (
+                    {similarityResults.length > RESULTS_PREVIEW_ROWS && (
                       <p className="table-note">
-                        Showing first 10 similarity pairs. Download the complete report for all {similarityResults.length} pairs.
+                        Showing first {RESULTS_PREVIEW_ROWS} similarity pairs. Download the complete report for all {similarityResults.length} pairs.
                       </p>
                     )}
                   </div>
@@ -682,10 +788,12 @@ function App() {
 
               {/* Panel Allocation Section */}
               {showPanelAllocation && (
-                <PanelAllocation
-                  projects={domainResults}
-                  similarityResults={similarityResults}
-                />
+                <Suspense fallback={<div className="loading-spinner"></div>}>
+                  <PanelAllocation
+                    projects={domainResults}
+                    similarityResults={similarityResults}
+                  />
+                </Suspense>
               )}
             </div>
           )}
@@ -715,12 +823,14 @@ function App() {
                 </div>
 
                 {showConstraintAllocation && (
-                  <ConstraintBasedPanelAllocation 
-                    similarityResults={similarityResults}
-                    hasFYPAnalysis={similarityResults && similarityResults.length > 0}
-                    excelData={projectsData}
-                    domainResults={domainResults}
-                  />
+                  <Suspense fallback={<div className="loading-spinner"></div>}>
+                    <ConstraintBasedPanelAllocation 
+                      similarityResults={similarityResults}
+                      hasFYPAnalysis={similarityResults && similarityResults.length > 0}
+                      excelData={projectsData}
+                      domainResults={domainResults}
+                    />
+                  </Suspense>
                 )}
               </div>
             </div>
@@ -448,7 +448,12 @@ ${instructorList}`;
                       <input
                         type="file"
                         accept=".xlsx,.xls"
-                        onChange={(e) => e.target.files[0] && handleExcelUpload(e.target.files[0])}
+                        onChange={(e) => {
+                          const file = e.target.files[0];
+                          // Clear the input so picking the same file again still fires onChange
+                          e.target.value = '';
+                          if (file) handleExcelUpload(file);
+                        }}
                         className="file-input-hidden"
                         disabled={isProcessing}
                       />
@@ -496,7 +501,11 @@ ${instructorList}`;
                   <input
                     type="file"
                     accept=".txt"
-                    onChange={(e) => e.target.files[0] && handleTextFileUpload(e.target.files[0])}
+                    onChange={(e) => {
+                      const file = e.target.files[0];
+                      e.target.value = '';
+                      if (file) handleTextFileUpload(file);
+                    }}
                     className="file-input-hidden"
                     disabled={isProcessing}
                   />
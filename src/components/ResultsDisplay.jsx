@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Download, Eye, BarChart3, FileText, Filter } from 'lucide-react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
+import { countUniqueDomains } from '../utils/textProcessing';
 
 const ResultsDisplay = ({ 
   domainResults, 
@@ -98,9 +99,7 @@ const ResultsDisplay = ({
             </div>
             <div>
               <p className="text-sm text-gray-600">Unique Domains</p>
-              <p className="text-2xl font-bold text-gray-900">
-                {new Set(domainResults.flatMap(p => Array.isArray(p.domains) ? p.domains : [p.domains])).size}
-              </p>
+              <p className="text-2xl font-bold text-gray-900">{countUniqueDomains(domainResults)}</p>
             </div>
           </div>
         </div>
@@ -345,7 +344,7 @@ const ResultsDisplay = ({
                         </span>
                       </td>
                       <td className="px-4 py-3 text-sm text-gray-700">
-                        {pair.overlappingDomains.join(', ') || 'None'}
+                        {pair.overlappingDomainsText || 'None'}
                       </td>
                       <td className="px-4 py-3 text-sm text-gray-700 max-w-xs" title={pair.explanation}>
                         {pair.explanation.length > 100 
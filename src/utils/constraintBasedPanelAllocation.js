@@ -1,3 +1,5 @@
+import { detectProjectDomains } from './textProcessing';
+
 /**
  * Constraint-Based Panel Allocation System
  * 
@@ -451,89 +453,6 @@ function extractDomainsFromPanelGroups(groups) {
   return domainCount;
 }
 
-/**
- * Simple domain detection based on keywords in project titles
- */
-function detectProjectDomains(projectTitle) {
-  const domains = [];
-  const title = projectTitle.toLowerCase();
-  
-  // AI/ML keywords
-  if (title.includes('ai') || title.includes('machine learning') || title.includes('neural') || 
-      title.includes('chatbot') || title.includes('nlp') || title.includes('computer vision') ||
-      title.includes('ml') || title.includes('artificial intelligence') || title.includes('deep learning')) {
-    domains.push('AI/ML');
-  }
-  
-  // Web Development
-  if (title.includes('web') || title.includes('website') || title.includes('e-commerce') || 
-      title.includes('platform') || title.includes('dashboard') || title.includes('portal') ||
-      title.includes('ecommerce') || title.includes('cms') || title.includes('blog')) {
-    domains.push('Web Development');
-  }
-  
-  // Mobile
-  if (title.includes('mobile') || title.includes('app') || title.includes('android') || 
-      title.includes('ios') || title.includes('flutter') || title.includes('react native') ||
-      title.includes('smartphone') || title.includes('tablet')) {
-    domains.push('Mobile Development');
-  }
-  
-  // IoT
-  if (title.includes('iot') || title.includes('smart home') || title.includes('sensor') || 
-      title.includes('automation') || title.includes('embedded') || title.includes('arduino') ||
-      title.includes('raspberry pi') || title.includes('smart') || title.includes('connected')) {
-    domains.push('IoT');
-  }
-  
-  // Cybersecurity
-  if (title.includes('security') || title.includes('cyber') || title.includes('encryption') || 
-      title.includes('blockchain') || title.includes('penetration') || title.includes('firewall') ||
-      title.includes('vulnerability') || title.includes('threat') || title.includes('secure')) {
-    domains.push('Cybersecurity');
-  }
-  
-  // Education
-  if (title.includes('education') || title.includes('learning') || title.includes('teaching') || 
-      title.includes('student') || title.includes('quiz') || title.includes('course') ||
-      title.includes('tutorial') || title.includes('exam') || title.includes('school')) {
-    domains.push('Education');
-  }
-  
-  // VR/AR
-  if (title.includes('vr') || title.includes('ar') || title.includes('virtual reality') || 
-      title.includes('augmented reality') || title.includes('3d') || title.includes('metaverse')) {
-    domains.push('VR/AR');
-  }
-  
-  // Game Development
-  if (title.includes('game') || title.includes('gaming') || title.includes('unity') || 
-      title.includes('graphics') || title.includes('animation') || title.includes('entertainment')) {
-    domains.push('Game Development');
-  }
-  
-  // Healthcare
-  if (title.includes('health') || title.includes('medical') || title.includes('hospital') || 
-      title.includes('patient') || title.includes('doctor') || title.includes('medicine') ||
-      title.includes('telemedicine') || title.includes('pharmacy')) {
-    domains.push('Healthcare');
-  }
-  
-  // Finance
-  if (title.includes('finance') || title.includes('banking') || title.includes('payment') || 
-      title.includes('trading') || title.includes('investment') || title.includes('budget') ||
-      title.includes('accounting') || title.includes('cryptocurrency')) {
-    domains.push('Finance');
-  }
-  
-  // Default to General if no specific domain detected
-  if (domains.length === 0) {
-    domains.push('General');
-  }
-  
-  return domains;
-}
-
 /**
  * Combine two domain distributions
  */
@@ -598,11 +517,11 @@ function distributeNonSupervisorInstructors(panels, allInstructors, constraints)
   });
 
   // Log final instructor distribution
-  console.log('\n📊 Final Instructor Distribution:');
-  panels.forEach(panel => {
+  const distributionLines = panels.map(panel => {
     const status = panel.instructors.size >= constraints.instructorsPerPanel ? '✅' : '⚠️';
-    console.log(`${status} Panel ${panel.panelNumber}: ${panel.instructors.size}/${constraints.instructorsPerPanel} instructors`);
+    return `${status} Panel ${panel.panelNumber}: ${panel.instructors.size}/${constraints.instructorsPerPanel} instructors`;
   });
+  console.log(['\n📊 Final Instructor Distribution:', ...distributionLines].join('\n'));
   
   // Add instructor balance analysis to allocation results
   const instructorCounts = panels.map(p => p.instructors.size);
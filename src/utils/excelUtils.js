@@ -1,64 +1,127 @@
 import * as XLSX from 'xlsx';
 import { saveAs } from 'file-saver';
 
+// Parsed uploads keyed by file identity, so loading the same workbook again
+// (e.g. from the panel creation screen) reuses the earlier parse
+const parsedFileCache = new Map();
+// Only the most recent uploads are kept, so a long session of trying
+// different files does not hold every parsed workbook in memory
+const MAX_CACHED_FILES = 3;
+
+function getFileCacheKey(file) {
+  return `${file.name}:${file.size}:${file.lastModified}`;
+}
+
+// Report sheets built from a given results array. The domain, similarity and
+// combined exports share these instead of rebuilding the same sheets
+const domainSheetsCache = new WeakMap();
+const similaritySheetsCache = new WeakMap();
+
+// Parsed explanation sections per similarity pair; each pair appears on both
+// the main similarity sheet and its level sheet
+const explanationSectionsCache = new WeakMap();
+
+// Serialized reports per results array, so repeat downloads reuse the blob.
+// The combined report also remembers which similarity results it was built with
+const domainReportCache = new WeakMap();
+const similarityReportCache = new WeakMap();
+const combinedReportCache = new WeakMap();
+
+// Serialize a workbook to an .xlsx blob. Compression deflates the sheet XML
+// inside the .xlsx, so large reports download and save much smaller.
+function createWorkbookBlob(workbook) {
+  const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array', compression: true });
+  return new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
+}
+
+// Serialize a workbook and download it
+function saveWorkbook(workbook, filename) {
+  saveAs(createWorkbookBlob(workbook), filename);
+}
+
+// Serialized report for a results array, building the workbook on first use
+function getReportBlob(cache, data, buildWorkbook) {
+  let blob = cache.get(data);
+  if (!blob) {
+    blob = createWorkbookBlob(buildWorkbook(data));
+    cache.set(data, blob);
+  }
+  return blob;
+}
+
 // Read Excel file and extract project data
 export function readExcelFile(file) {
-  return new Promise((resolve, reject) => {
-    const reader = new FileReader();
-    
-    reader.onload = (e) => {
+  const cacheKey = getFileCacheKey(file);
+  if (parsedFileCache.has(cacheKey)) {
+    // Re-insert so the entry counts as most recently used
+    const cached = parsedFileCache.get(cacheKey);
+    parsedFileCache.delete(cacheKey);
+    parsedFileCache.set(cacheKey, cached);
+    return Promise.resolve(cached);
+  }
+
+  // Blob.arrayBuffer() reads the upload straight into the one buffer SheetJS
+  // parses; an .xlsx is a zip archive, so it cannot be parsed in chunks
+  return file.arrayBuffer().then(
+    buffer => {
       try {
-        const data = new Uint8Array(e.target.result);
-        const workbook = XLSX.read(data, { type: 'array' });
-        
+        const data = new Uint8Array(buffer);
+        // Only cell values of the first sheet are used, so skip parsing the
+        // remaining sheets and formula, HTML and formatted-text output.
+        // Dense mode keeps rows as arrays instead of one keyed object per cell
+        const workbook = XLSX.read(data, {
+          type: 'array',
+          dense: true,
+          sheets: 0,
+          cellFormula: false,
+          cellHTML: false,
+          cellText: false
+        });
+      
         // Get the first worksheet
         const firstSheetName = workbook.SheetNames[0];
         const worksheet = workbook.Sheets[firstSheetName];
-        
-        // Convert to JSON
+      
+        // Convert to JSON. Empty cells are left out of each row rather than
+        // filled in, so blank columns past the headers (a sheet's range often
+        // runs to Z) add no __EMPTY keys, and rows need no cleaning pass
         const jsonData = XLSX.utils.sheet_to_json(worksheet);
-        
+      
         // Standardize column names while preserving ALL original data
-        const standardizedData = jsonData.map((row, index) => {
-          const standardRow = {
-            projectId: row['Short_Title'] || row['Project Short Title'] || `Project_${index + 1}`,
-            projectTitle: row['Project Title'] || '',
-            projectScope: row['Project Scope'] || '',
-            primaryDomain: row['Categorize the primary domain of project'] || '',
-            subCategory: row['Sub-category of the project'] || '',
-            // Preserve supervisor information - CRITICAL for panel allocation
-            supervisor: row['Supervisor'] || '',
-            // Preserve ALL original columns for compatibility
-            ...row
-          };
-          
-          // Clean empty values
-          Object.keys(standardRow).forEach(key => {
-            if (standardRow[key] === undefined || standardRow[key] === null) {
-              standardRow[key] = '';
-            }
-          });
-          
-          return standardRow;
-        });
-        
-        resolve({
+        const standardizedData = jsonData.map((row, index) => ({
+          projectId: row['Short_Title'] || row['Project Short Title'] || `Project_${index + 1}`,
+          // Title and scope are always strings (numeric cells included), so
+          // the text processing downstream needs no per-call type checks
+          projectTitle: String(row['Project Title'] || ''),
+          projectScope: String(row['Project Scope'] || ''),
+          primaryDomain: row['Categorize the primary domain of project'] || '',
+          subCategory: row['Sub-category of the project'] || '',
+          // Preserve supervisor information - CRITICAL for panel allocation
+          supervisor: row['Supervisor'] || '',
+          // Preserve ALL original columns for compatibility
+          ...row
+        }));
+      
+        const result = {
           data: standardizedData,
           totalProjects: standardizedData.length,
           sheetNames: workbook.SheetNames
-        });
+        };
+        parsedFileCache.set(cacheKey, result);
+        if (parsedFileCache.size > MAX_CACHED_FILES) {
+          // Maps iterate in insertion order, so the first key is the oldest
+          parsedFileCache.delete(parsedFileCache.keys().next().value);
+        }
+        return result;
         
       } catch (error) {
-        reject(new Error(`Failed to read Excel file: ${error.message}`));
+        throw new Error(`Failed to read Excel file: ${error.message}`);
       }
-    };
-    
-    reader.onerror = () => {
-      reject(new Error('Failed to read file'));
-    };
-    
-    reader.readAsArrayBuffer(file);
-  });
+    },
+    () => {
+      throw new Error('Failed to read file');
+    }
+  );
 }
 
 // Create Excel workbook with multiple sheets
@@ -67,152 +130,181 @@ export function createExcelWorkbook(domainData, similarityData) {
   
   // Create domain categorization sheet
   if (domainData && domainData.length > 0) {
-    const domainSheet = createDomainSheet(domainData);
-    XLSX.utils.book_append_sheet(workbook, domainSheet, 'Project_Domains');
+    appendDomainSheets(workbook, domainData);
+  }
+  
+  // Create similarity analysis sheet
+  if (similarityData && similarityData.length > 0) {
+    appendSimilaritySheets(workbook, similarityData);
+  }
+  
+  return workbook;
+}
+
+// Append the domain categorization sheet plus one sheet per domain
+function appendDomainSheets(workbook, domainData) {
+  let sheets = domainSheetsCache.get(domainData);
+  if (!sheets) {
+    sheets = [['Project_Domains', createDomainSheet(domainData)]];
     
     // Create separate sheets for each domain
     const domainGroups = groupByDomains(domainData);
     Object.entries(domainGroups).forEach(([domain, projects]) => {
-      if (projects.length > 0) {
-        const sheetName = sanitizeSheetName(domain);
-        const domainSpecificSheet = XLSX.utils.json_to_sheet(projects);
-        XLSX.utils.book_append_sheet(workbook, domainSpecificSheet, sheetName);
-      }
+      sheets.push([sanitizeSheetName(domain), createTableSheet(DOMAIN_GROUP_SHEET_HEADERS, projects)]);
     });
+    domainSheetsCache.set(domainData, sheets);
   }
   
-  // Create similarity analysis sheet
-  if (similarityData && similarityData.length > 0) {
-    const similaritySheet = createSimilaritySheet(similarityData);
-    XLSX.utils.book_append_sheet(workbook, similaritySheet, 'Project_Similarities');
+  sheets.forEach(([sheetName, sheet]) => XLSX.utils.book_append_sheet(workbook, sheet, sheetName));
+}
+
+// Append the main similarity sheet plus one sheet per similarity level
+function appendSimilaritySheets(workbook, similarityData) {
+  let sheets = similaritySheetsCache.get(similarityData);
+  if (!sheets) {
+    sheets = [['Project_Similarities', createSimilaritySheet(similarityData)]];
     
     // Create sheets by similarity level
     const similarityGroups = groupBySimilarityLevel(similarityData);
     Object.entries(similarityGroups).forEach(([level, pairs]) => {
       if (pairs.length > 0) {
-        const sheetName = `${level}_Similarity`;
-        const levelSheet = createDetailedSimilaritySheet(pairs);
-        XLSX.utils.book_append_sheet(workbook, levelSheet, sheetName);
+        sheets.push([`${level}_Similarity`, createDetailedSimilaritySheet(pairs)]);
       }
     });
+    similaritySheetsCache.set(similarityData, sheets);
   }
   
-  return workbook;
+  sheets.forEach(([sheetName, sheet]) => XLSX.utils.book_append_sheet(workbook, sheet, sheetName));
+}
+
+// Split a pair's explanation into its header, reasons and interpretation
+function getExplanationSections(pair) {
+  let sections = explanationSectionsCache.get(pair);
+  if (sections) {
+    return sections;
+  }
+  
+  const explanation = pair.explanation || '';
+  const lines = explanation.split('\n');
+  
+  // Extract different sections from the explanation
+  let specificReasons = [];
+  let interpretation = '';
+  let analysisHeader = '';
+  
+  let currentSection = '';
+  lines.forEach(line => {
+    const trimmed = line.trim();
+    if (trimmed.startsWith('SIMILARITY ANALYSIS')) {
+      analysisHeader = trimmed;
+      currentSection = 'analysis';
+    } else if (trimmed === 'SPECIFIC REASONS:') {
+      currentSection = 'reasons';
+    } else if (trimmed === 'SIMILARITY INTERPRETATION:') {
+      currentSection = 'interpretation';
+    } else if (trimmed.startsWith('✓') && currentSection === 'reasons') {
+      specificReasons.push(trimmed);
+    } else if (trimmed.startsWith('→') && currentSection === 'interpretation') {
+      interpretation = trimmed.substring(2).trim(); // Remove arrow
+    }
+  });
+  
+  sections = {
+    explanation,
+    analysisHeader,
+    specificReasons: specificReasons.join(' | '),
+    interpretation
+  };
+  explanationSectionsCache.set(pair, sections);
+  return sections;
+}
+
+// Build a dense worksheet from a fixed header row and row arrays. Result
+// sheets can run to thousands of rows, and rows as arrays avoid a keyed
+// object per row plus json_to_sheet's per-row key scan
+function createTableSheet(headers, rows) {
+  return XLSX.utils.aoa_to_sheet([headers, ...rows], { dense: true });
 }
 
+const DOMAIN_SHEET_HEADERS = ['Project ID', 'Project Title', 'Primary Domain', 'All Domains', 'Categorization Method', 'Confidence Score'];
+const DOMAIN_GROUP_SHEET_HEADERS = ['Project ID', 'Project Title', 'Project Scope', 'Confidence Score', 'Method'];
+const SIMILARITY_SHEET_HEADERS = ['Project 1 ID', 'Project 2 ID', 'Similarity Score', 'Similarity Level', 'Overlapping Domains', 'Analysis Summary', 'Specific Reasons', 'Interpretation', 'Full Explanation'];
+const DETAILED_SIMILARITY_SHEET_HEADERS = ['Project 1 ID', 'Project 2 ID', 'Similarity Score', 'Overlapping Domains', 'Specific Reasons', 'Interpretation', 'Full Explanation'];
+
 // Create domain categorization sheet
 function createDomainSheet(domainData) {
-  const sheetData = domainData.map(project => ({
-    'Project ID': project.projectId,
-    'Project Title': project.projectTitle,
-    'Primary Domain': project.primaryDomain,
-    'All Domains': Array.isArray(project.domains) ? project.domains.join(', ') : project.domains,
-    'Categorization Method': project.categorizationMethod || 'keyword_matching',
-    'Confidence Score': project.maxConfidenceScore || 'N/A'
-  }));
+  const rows = domainData.map(project => [
+    project.projectId,
+    project.projectTitle,
+    project.primaryDomain,
+    Array.isArray(project.domains) ? project.domains.join(', ') : project.domains,
+    project.categorizationMethod || 'keyword_matching',
+    project.maxConfidenceScore || 'N/A'
+  ]);
   
-  return XLSX.utils.json_to_sheet(sheetData);
+  return createTableSheet(DOMAIN_SHEET_HEADERS, rows);
 }
 
 // Create enhanced similarity analysis sheet with detailed breakdown
 function createSimilaritySheet(similarityData) {
-  const sheetData = similarityData.map(pair => {
+  const rows = similarityData.map(pair => {
     // Parse the detailed explanation to extract components
-    const explanation = pair.explanation || '';
-    const lines = explanation.split('\n');
-    
-    // Extract different sections from the explanation
-    let specificReasons = [];
-    let interpretation = '';
-    let analysisHeader = '';
-    
-    let currentSection = '';
-    lines.forEach(line => {
-      const trimmed = line.trim();
-      if (trimmed.startsWith('SIMILARITY ANALYSIS')) {
-        analysisHeader = trimmed;
-        currentSection = 'analysis';
-      } else if (trimmed === 'SPECIFIC REASONS:') {
-        currentSection = 'reasons';
-      } else if (trimmed === 'SIMILARITY INTERPRETATION:') {
-        currentSection = 'interpretation';
-      } else if (trimmed.startsWith('✓') && currentSection === 'reasons') {
-        specificReasons.push(trimmed);
-      } else if (trimmed.startsWith('→') && currentSection === 'interpretation') {
-        interpretation = trimmed.substring(2).trim(); // Remove arrow
-      }
-    });
-
-    return {
-      'Project 1 ID': pair.project1Id,
-      'Project 2 ID': pair.project2Id,
-      'Similarity Score': `${(pair.similarityScore * 100).toFixed(1)}%`,
-      'Similarity Level': pair.similarityLevel,
-      'Overlapping Domains': pair.overlappingDomains.join(', '),
-      'Analysis Summary': analysisHeader,
-      'Specific Reasons': specificReasons.join(' | '),
-      'Interpretation': interpretation,
-      'Full Explanation': explanation
-    };
+    const { explanation, analysisHeader, specificReasons, interpretation } = getExplanationSections(pair);
+
+    return [
+      pair.project1Id,
+      pair.project2Id,
+      `${(pair.similarityScore * 100).toFixed(1)}%`,
+      pair.similarityLevel,
+      pair.overlappingDomainsText,
+      analysisHeader,
+      specificReasons,
+      interpretation,
+      explanation
+    ];
   });
   
-  return XLSX.utils.json_to_sheet(sheetData);
+  return createTableSheet(SIMILARITY_SHEET_HEADERS, rows);
 }
 
 // Create detailed similarity sheet for level-specific sheets
 function createDetailedSimilaritySheet(pairs) {
-  return XLSX.utils.json_to_sheet(pairs.map(pair => {
+  return createTableSheet(DETAILED_SIMILARITY_SHEET_HEADERS, pairs.map(pair => {
     // Parse explanation for detailed breakdown
-    const explanation = pair.explanation || '';
-    const lines = explanation.split('\n');
-    let specificReasons = [];
-    let interpretation = '';
-    
-    let currentSection = '';
-    lines.forEach(line => {
-      const trimmed = line.trim();
-      if (trimmed === 'SPECIFIC REASONS:') {
-        currentSection = 'reasons';
-      } else if (trimmed === 'SIMILARITY INTERPRETATION:') {
-        currentSection = 'interpretation';
-      } else if (trimmed.startsWith('✓') && currentSection === 'reasons') {
-        specificReasons.push(trimmed);
-      } else if (trimmed.startsWith('→') && currentSection === 'interpretation') {
-        interpretation = trimmed.substring(2).trim();
-      }
-    });
-
-    return {
-      'Project 1 ID': pair.project1Id,
-      'Project 2 ID': pair.project2Id,
-      'Similarity Score': `${(pair.similarityScore * 100).toFixed(1)}%`,
-      'Overlapping Domains': pair.overlappingDomains.join(', '),
-      'Specific Reasons': specificReasons.join(' | '),
-      'Interpretation': interpretation,
-      'Full Explanation': explanation
-    };
+    const { explanation, specificReasons, interpretation } = getExplanationSections(pair);
+
+    return [
+      pair.project1Id,
+      pair.project2Id,
+      `${(pair.similarityScore * 100).toFixed(1)}%`,
+      pair.overlappingDomainsText,
+      specificReasons,
+      interpretation,
+      explanation
+    ];
   }));
 }
 
-// Group projects by domains
+// Group projects by domains in a single pass; every group is non-empty
 function groupByDomains(domainData) {
   const groups = {};
   
   domainData.forEach(project => {
     const domains = Array.isArray(project.domains) ? project.domains : [project.domains];
     
-    domains.forEach(domain => {
+    // A project listing a domain twice still gets one row on its sheet
+    new Set(domains).forEach(domain => {
       if (!groups[domain]) {
         groups[domain] = [];
       }
       
-      groups[domain].push({
-        'Project ID': project.projectId,
-        'Project Title': project.projectTitle,
-        'Project Scope': project.projectScope,
-        'Confidence Score': project.confidenceScores?.[domain]?.score || 'N/A',
-        'Method': project.confidenceScores?.[domain]?.method || 'N/A'
-      });
+      groups[domain].push([
+        project.projectId,
+        project.projectTitle,
+        project.projectScope,
+        project.confidenceScores?.[domain]?.score || 'N/A',
+        project.confidenceScores?.[domain]?.method || 'N/A'
+      ]);
     });
   });
   
@@ -248,25 +340,15 @@ function sanitizeSheetName(name) {
 // Export domain categorization to Excel
 export function exportDomainCategorization(domainData, filename = 'fyp_domain_categorization.xlsx') {
   try {
-    const workbook = XLSX.utils.book_new();
-    
-    // Main domain sheet
-    const domainSheet = createDomainSheet(domainData);
-    XLSX.utils.book_append_sheet(workbook, domainSheet, 'Project_Domains');
-    
-    // Domain-specific sheets
-    const domainGroups = groupByDomains(domainData);
-    Object.entries(domainGroups).forEach(([domain, projects]) => {
-      if (projects.length > 0) {
-        const sheetName = sanitizeSheetName(domain);
-        const domainSpecificSheet = XLSX.utils.json_to_sheet(projects);
-        XLSX.utils.book_append_sheet(workbook, domainSpecificSheet, sheetName);
-      }
+    const blob = getReportBlob(domainReportCache, domainData, data => {
+      const workbook = XLSX.utils.book_new();
+      
+      // Main domain sheet and domain-specific sheets
+      appendDomainSheets(workbook, data);
+      return workbook;
     });
     
-    // Convert to blob and download
-    const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-    const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
+    // Download
     saveAs(blob, filename);
     
     return true;
@@ -279,25 +361,15 @@ export function exportDomainCategorization(domainData, filename = 'fyp_domain_ca
 // Export similarity analysis to Excel
 export function exportSimilarityAnalysis(similarityData, filename = 'fyp_similarity_analysis.xlsx') {
   try {
-    const workbook = XLSX.utils.book_new();
-    
-    // Main similarity sheet
-    const similaritySheet = createSimilaritySheet(similarityData);
-    XLSX.utils.book_append_sheet(workbook, similaritySheet, 'Project_Similarities');
-    
-    // Similarity level sheets
-    const similarityGroups = groupBySimilarityLevel(similarityData);
-    Object.entries(similarityGroups).forEach(([level, pairs]) => {
-      if (pairs.length > 0) {
-        const sheetName = `${level}_Similarity`;
-        const levelSheet = createDetailedSimilaritySheet(pairs);
-        XLSX.utils.book_append_sheet(workbook, levelSheet, sheetName);
-      }
+    const blob = getReportBlob(similarityReportCache, similarityData, data => {
+      const workbook = XLSX.utils.book_new();
+      
+      // Main similarity sheet and similarity level sheets
+      appendSimilaritySheets(workbook, data);
+      return workbook;
     });
     
-    // Convert to blob and download
-    const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-    const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
+    // Download
     saveAs(blob, filename);
     
     return true;
@@ -310,11 +382,19 @@ export function exportSimilarityAnalysis(similarityData, filename = 'fyp_similar
 // Export both reports as a combined Excel file
 export function exportCombinedReports(domainData, similarityData, filename = 'fyp_analysis_complete.xlsx') {
   try {
-    const workbook = createExcelWorkbook(domainData, similarityData);
+    // Built only when requested, then reused until the results change
+    const cached = domainData ? combinedReportCache.get(domainData) : null;
+    let blob;
+    if (cached && cached.similarityData === similarityData) {
+      blob = cached.blob;
+    } else {
+      blob = createWorkbookBlob(createExcelWorkbook(domainData, similarityData));
+      if (domainData) {
+        combinedReportCache.set(domainData, { similarityData, blob });
+      }
+    }
     
-    // Convert to blob and download
-    const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-    const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
+    // Download
     saveAs(blob, filename);
     
     return true;
@@ -439,10 +519,8 @@ export function exportPanelAllocationReport(panelReport, filename = 'panel_alloc
       XLSX.utils.book_append_sheet(workbook, suggestionsSheet, 'Suggestions');
     }
 
-    // Convert to blob and download
-    const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-    const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
-    saveAs(blob, filename);
+    // Write and download
+    saveWorkbook(workbook, filename);
 
     return true;
   } catch (error) {
@@ -558,10 +636,8 @@ export function exportConstraintBasedPanelAllocation(allocationResult, filename
       }
     }
 
-    // Convert to blob and download
-    const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-    const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
-    saveAs(blob, filename);
+    // Write and download
+    saveWorkbook(workbook, filename);
 
     return true;
   } catch (error) {
@@ -652,10 +728,8 @@ export function exportSupervisorStatistics(supervisorStats, filename = 'supervis
       XLSX.utils.book_append_sheet(workbook, distributionSheet, 'Distribution');
     }
 
-    // Convert to blob and download
-    const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-    const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
-    saveAs(blob, filename);
+    // Write and download
+    saveWorkbook(workbook, filename);
 
     return true;
   } catch (error) {
@@ -664,41 +738,42 @@ export function exportSupervisorStatistics(supervisorStats, filename = 'supervis
   }
 }
 
+// Sample FYP data: header row followed by one array per project, matching the upload format
+const SAMPLE_PROJECTS = [
+  ['Project Title', 'Project Scope', 'Short_Title'],
+  [
+    'AI-Powered Chatbot for Customer Service',
+    'Development of an intelligent chatbot using natural language processing and machine learning to handle customer inquiries automatically. The system will use deep learning models to understand customer intent and provide accurate responses.',
+    'F24-001-AI-Chatbot'
+  ],
+  [
+    'E-commerce Website with Recommendation System',
+    'Building a comprehensive e-commerce platform with integrated recommendation engine. Uses collaborative filtering and machine learning algorithms to suggest products to customers based on their browsing history and preferences.',
+    'F24-002-Ecom-Rec'
+  ],
+  [
+    'Smart Home IoT Security System',
+    'Development of a comprehensive security system for smart homes using IoT sensors, cameras, and machine learning for threat detection. Includes mobile app for monitoring and real-time alerts.',
+    'F24-003-IoT-Security'
+  ],
+  [
+    'Virtual Reality Game for Education',
+    'Creating an immersive VR educational game using Unity 3D. The game teaches physics concepts through interactive simulations and gamification elements to enhance learning experience.',
+    'F24-004-VR-Education'
+  ],
+  [
+    'Blockchain-based Voting System',
+    'Secure electronic voting system using blockchain technology to ensure transparency and prevent fraud. Implements smart contracts for vote counting and verification.',
+    'F24-005-Blockchain-Vote'
+  ]
+];
+
 // Create sample Excel file for testing
 export function createSampleExcelFile() {
-  const sampleData = [
-    {
-      'Project Title': 'AI-Powered Chatbot for Customer Service',
-      'Project Scope': 'Development of an intelligent chatbot using natural language processing and machine learning to handle customer inquiries automatically. The system will use deep learning models to understand customer intent and provide accurate responses.',
-      'Short_Title': 'F24-001-AI-Chatbot'
-    },
-    {
-      'Project Title': 'E-commerce Website with Recommendation System',
-      'Project Scope': 'Building a comprehensive e-commerce platform with integrated recommendation engine. Uses collaborative filtering and machine learning algorithms to suggest products to customers based on their browsing history and preferences.',
-      'Short_Title': 'F24-002-Ecom-Rec'
-    },
-    {
-      'Project Title': 'Smart Home IoT Security System',
-      'Project Scope': 'Development of a comprehensive security system for smart homes using IoT sensors, cameras, and machine learning for threat detection. Includes mobile app for monitoring and real-time alerts.',
-      'Short_Title': 'F24-003-IoT-Security'
-    },
-    {
-      'Project Title': 'Virtual Reality Game for Education',
-      'Project Scope': 'Creating an immersive VR educational game using Unity 3D. The game teaches physics concepts through interactive simulations and gamification elements to enhance learning experience.',
-      'Short_Title': 'F24-004-VR-Education'
-    },
-    {
-      'Project Title': 'Blockchain-based Voting System',
-      'Project Scope': 'Secure electronic voting system using blockchain technology to ensure transparency and prevent fraud. Implements smart contracts for vote counting and verification.',
-      'Short_Title': 'F24-005-Blockchain-Vote'
-    }
-  ];
-  
   const workbook = XLSX.utils.book_new();
-  const worksheet = XLSX.utils.json_to_sheet(sampleData);
+  // Dense worksheets store rows as arrays instead of one keyed object per cell
+  const worksheet = XLSX.utils.aoa_to_sheet(SAMPLE_PROJECTS, { dense: true });
   XLSX.utils.book_append_sheet(workbook, worksheet, 'Sample_FYP_Data');
   
-  const excelBuffer = XLSX.write(workbook, { bookType: 'xlsx', type: 'array' });
-  const blob = new Blob([excelBuffer], { type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet' });
-  saveAs(blob, 'sample_fyp_data.xlsx');
+  saveWorkbook(workbook, 'sample_fyp_data.xlsx');
 } 
\ No newline at end of file
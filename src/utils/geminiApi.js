@@ -1,9 +1,25 @@
 import { GoogleGenerativeAI } from '@google/generative-ai';
-import { DOMAIN_KEYWORDS } from './textProcessing';
+import { DOMAIN_KEYWORDS, SIMILARITY_THRESHOLD, compileDomainPattern } from './textProcessing';
 
 let genAI = null;
 let model = null;
 
+// Domain list embedded in every categorization prompt, built once
+const DOMAINS_PROMPT_LIST = Object.keys(DOMAIN_KEYWORDS).join(', ');
+
+// Parse the JSON object out of a model response, ignoring any markdown code
+// fences or prose around it
+function parseJsonResponse(responseText) {
+  const start = responseText.indexOf('{');
+  const end = responseText.lastIndexOf('}');
+
+  if (start === -1 || end < start) {
+    return JSON.parse(responseText.trim());
+  }
+
+  return JSON.parse(responseText.slice(start, end + 1));
+}
+
 // Initialize Gemini AI
 export function initializeGemini(apiKey) {
   try {
@@ -32,9 +48,6 @@ export async function categorizeWithGemini(projectTitle, projectScope) {
     throw new Error('Gemini AI not initialized');
   }
 
-  const domainsList = Object.keys(DOMAIN_KEYWORDS);
-  const domainsStr = domainsList.join(', ');
-
   const prompt = `
   You are a domain expert.
 Analyze the following Final Year Project (FYP) and categorize it into one or more relevant technical domains.
@@ -43,7 +56,7 @@ Project Title: ${projectTitle}
 Project Description: ${projectScope}
 
 Available Domains:
-${domainsStr}
+${DOMAINS_PROMPT_LIST}
 
 if in case the project is not related to any of the domains, suggest the what domain it is related to as per your own knowledge.
 
@@ -78,17 +91,8 @@ Respond in JSON format:
   try {
     const result = await model.generateContent(prompt);
     const response = await result.response;
-    let responseText = response.text().trim();
-
-    // Clean up response if it has markdown formatting
-    if (responseText.includes('```json')) {
-      responseText = responseText.split('```json')[1].split('```')[0].trim();
-    } else if (responseText.includes('```')) {
-      responseText = responseText.split('```')[1].trim();
-    }
-
     // Parse JSON response
-    const parsedResult = JSON.parse(responseText);
+    const parsedResult = parseJsonResponse(response.text());
     
     // Validate the response structure
     if (!parsedResult.domains || !Array.isArray(parsedResult.domains)) {
@@ -109,43 +113,77 @@ Respond in JSON format:
   }
 }
 
+// Number of categorization requests kept in flight at once
+const CATEGORIZATION_CONCURRENCY = 4;
+
+// Minimum spacing between categorization request starts, shared by all workers
+const CATEGORIZATION_REQUEST_INTERVAL_MS = 500;
+
+// Successful categorizations keyed by project text, so re-running the analysis
+// on the same data skips the paid API calls
+const categorizationCache = new Map();
+
 // Batch categorize multiple projects
 export async function batchCategorizeWithGemini(projects, onProgress) {
-  const results = [];
+  const results = new Array(projects.length);
   const total = projects.length;
+  let nextIndex = 0;
+  let completed = 0;
+  // Earliest time the next API request may start
+  let nextRequestAt = 0;
+
+  // Each worker takes the next unclaimed project until none are left
+  const worker = async () => {
+    while (nextIndex < projects.length) {
+      const i = nextIndex++;
+      const project = projects[i];
+      const cacheKey = `${project.projectTitle}\u0000${project.projectScope}`;
 
-  for (let i = 0; i < projects.length; i++) {
-    const project = projects[i];
-    
-    try {
-      // Add small delay to avoid rate limiting
-      if (i > 0) {
-        await new Promise(resolve => setTimeout(resolve, 500));
-      }
+      try {
+        let result = categorizationCache.get(cacheKey);
+
+        if (!result) {
+          // Space requests across all workers to avoid rate limiting; the
+          // slot is claimed before waiting so workers queue behind each other
+          const now = Date.now();
+          const startAt = Math.max(now, nextRequestAt);
+          nextRequestAt = startAt + CATEGORIZATION_REQUEST_INTERVAL_MS;
+          if (startAt > now) {
+            await new Promise(resolve => setTimeout(resolve, startAt - now));
+          }
+
+          result = await categorizeWithGemini(project.projectTitle, project.projectScope);
+          if (result.success) {
+            categorizationCache.set(cacheKey, result);
+          }
+        }
 
-      const result = await categorizeWithGemini(project.projectTitle, project.projectScope);
-      
-      results.push({
-        projectId: project.projectId,
-        result: result
-      });
+        results[i] = {
+          projectId: project.projectId,
+          result: result
+        };
+
+      } catch (error) {
+        console.error(`Failed to categorize project ${project.projectId}:`, error);
+        results[i] = {
+          projectId: project.projectId,
+          result: {
+            success: false,
+            error: error.message
+          }
+        };
+      }
 
       // Call progress callback
+      completed++;
       if (onProgress) {
-        onProgress(i + 1, total, project.projectId);
+        onProgress(completed, total, project.projectId);
       }
-
-    } catch (error) {
-      console.error(`Failed to categorize project ${project.projectId}:`, error);
-      results.push({
-        projectId: project.projectId,
-        result: {
-          success: false,
-          error: error.message
-        }
-      });
     }
-  }
+  };
+
+  const workerCount = Math.min(CATEGORIZATION_CONCURRENCY, projects.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
 
   return results;
 }
@@ -223,16 +261,8 @@ Respond in JSON format:
   try {
     const result = await model.generateContent(prompt);
     const response = await result.response;
-    let responseText = response.text().trim();
-
-    // Clean up response if it has markdown formatting
-    if (responseText.includes('```json')) {
-      responseText = responseText.split('```json')[1].split('```')[0].trim();
-    } else if (responseText.includes('```')) {
-      responseText = responseText.split('```')[1].trim();
-    }
-
-    const parsedResult = JSON.parse(responseText);
+    // Parse JSON response
+    const parsedResult = parseJsonResponse(response.text());
     
     return {
       success: true,
@@ -248,49 +278,64 @@ Respond in JSON format:
   }
 }
 
-// Batch analyze project similarities with Gemini
-export async function batchAnalyzeSimilarityWithGemini(projects, onProgress) {
+// Batch analyze project similarities with Gemini. candidatePairs limits the
+// comparisons to the given { index1, index2 } pairs (e.g. each project's
+// nearest TF-IDF neighbours); without it every pair is compared.
+export async function batchAnalyzeSimilarityWithGemini(projects, onProgress, candidatePairs = null) {
   const results = [];
-  const threshold = 0.3;
-  const total = (projects.length * (projects.length - 1)) / 2;
-  let current = 0;
+  const threshold = SIMILARITY_THRESHOLD;
+  let pairs = candidatePairs;
+
+  if (!pairs) {
+    pairs = [];
+    for (let i = 0; i < projects.length; i++) {
+      for (let j = i + 1; j < projects.length; j++) {
+        pairs.push({ index1: i, index2: j });
+      }
+    }
+  }
 
-  for (let i = 0; i < projects.length; i++) {
-    for (let j = i + 1; j < projects.length; j++) {
-      current++;
-      
-      try {
-        // Add delay to avoid rate limiting
-        if (current > 1) {
-          await new Promise(resolve => setTimeout(resolve, 1000));
-        }
+  const total = pairs.length;
+  let current = 0;
 
-        const result = await analyzeProjectSimilarityWithGemini(projects[i], projects[j]);
-        
-        if (result.success && result.data.similarityScore > threshold) {
-          results.push({
-            project1Id: projects[i].projectId,
-            project2Id: projects[j].projectId,
-            similarityScore: result.data.similarityScore,
-            similarityLevel: result.data.similarityLevel,
-            overlappingDomains: result.data.overlappingAreas || [],
-            explanation: result.data.detailedAnalysis,
-            technicalSimilarity: result.data.technicalSimilarity,
-            domainSimilarity: result.data.domainSimilarity,
-            methodologySimilarity: result.data.methodologySimilarity,
-            keyDifferences: result.data.keyDifferences || [],
-            recommendation: result.data.recommendation,
-            analysisMethod: 'gemini_ai'
-          });
-        }
+  for (const { index1, index2 } of pairs) {
+    const project1 = projects[index1];
+    const project2 = projects[index2];
+    current++;
+    
+    try {
+      // Add delay to avoid rate limiting
+      if (current > 1) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+      }
 
-        if (onProgress) {
-          onProgress(current, total, `${projects[i].projectId} vs ${projects[j].projectId}`);
-        }
+      const result = await analyzeProjectSimilarityWithGemini(project1, project2);
+      
+      if (result.success && result.data.similarityScore > threshold) {
+        const overlappingDomains = result.data.overlappingAreas || [];
+        results.push({
+          project1Id: project1.projectId,
+          project2Id: project2.projectId,
+          similarityScore: result.data.similarityScore,
+          similarityLevel: result.data.similarityLevel,
+          overlappingDomains,
+          overlappingDomainsText: overlappingDomains.join(', '),
+          explanation: result.data.detailedAnalysis,
+          technicalSimilarity: result.data.technicalSimilarity,
+          domainSimilarity: result.data.domainSimilarity,
+          methodologySimilarity: result.data.methodologySimilarity,
+          keyDifferences: result.data.keyDifferences || [],
+          recommendation: result.data.recommendation,
+          analysisMethod: 'gemini_ai'
+        });
+      }
 
-      } catch (error) {
-        console.error(`Failed to analyze similarity between ${projects[i].projectId} and ${projects[j].projectId}:`, error);
+      if (onProgress) {
+        onProgress(current, total, `${project1.projectId} vs ${project2.projectId}`);
       }
+
+    } catch (error) {
+      console.error(`Failed to analyze similarity between ${project1.projectId} and ${project2.projectId}:`, error);
     }
   }
 
@@ -354,15 +399,8 @@ Respond in JSON format:
   try {
     const result = await model.generateContent(prompt);
     const response = await result.response;
-    let responseText = response.text().trim();
-
-    if (responseText.includes('```json')) {
-      responseText = responseText.split('```json')[1].split('```')[0].trim();
-    } else if (responseText.includes('```')) {
-      responseText = responseText.split('```')[1].trim();
-    }
-
-    const parsedResult = JSON.parse(responseText);
+    // Parse JSON response
+    const parsedResult = parseJsonResponse(response.text());
     
     return {
       success: true,
@@ -457,15 +495,8 @@ Respond in JSON format:
   try {
     const result = await model.generateContent(prompt);
     const response = await result.response;
-    let responseText = response.text().trim();
-
-    if (responseText.includes('```json')) {
-      responseText = responseText.split('```json')[1].split('```')[0].trim();
-    } else if (responseText.includes('```')) {
-      responseText = responseText.split('```')[1].trim();
-    }
-
-    const parsedResult = JSON.parse(responseText);
+    // Parse JSON response
+    const parsedResult = parseJsonResponse(response.text());
     
     return {
       success: true,
@@ -481,21 +512,25 @@ Respond in JSON format:
   }
 }
 
+// Coarse title keywords per domain, checked in priority order
+const TITLE_DOMAIN_PATTERNS = [
+  ['AI/ML', ['ai', 'ml', 'chatbot', 'neural']],
+  ['Web Development', ['web', 'website', 'platform', 'ecommerce']],
+  ['Mobile Development', ['mobile', 'app', 'android', 'ios']],
+  ['IoT', ['iot', 'smart', 'sensor', 'automation']],
+  ['Cybersecurity', ['security', 'cyber', 'blockchain', 'encryption']],
+  ['Healthcare', ['health', 'medical', 'hospital', 'patient']],
+  ['Education', ['education', 'learning', 'student', 'quiz']],
+  ['Finance', ['finance', 'banking', 'payment', 'trading']],
+  ['Gaming/VR', ['game', 'vr', 'ar', '3d']]
+].map(([domain, keywords]) => ({ domain, pattern: compileDomainPattern(keywords) }));
+
 // Helper function to detect project domain from title
 function detectProjectDomain(projectTitle) {
   const title = projectTitle.toLowerCase();
+  const match = TITLE_DOMAIN_PATTERNS.find(({ pattern }) => pattern.test(title));
   
-  if (title.includes('ai') || title.includes('ml') || title.includes('chatbot') || title.includes('neural')) return 'AI/ML';
-  if (title.includes('web') || title.includes('website') || title.includes('platform') || title.includes('ecommerce')) return 'Web Development';
-  if (title.includes('mobile') || title.includes('app') || title.includes('android') || title.includes('ios')) return 'Mobile Development';
-  if (title.includes('iot') || title.includes('smart') || title.includes('sensor') || title.includes('automation')) return 'IoT';
-  if (title.includes('security') || title.includes('cyber') || title.includes('blockchain') || title.includes('encryption')) return 'Cybersecurity';
-  if (title.includes('health') || title.includes('medical') || title.includes('hospital') || title.includes('patient')) return 'Healthcare';
-  if (title.includes('education') || title.includes('learning') || title.includes('student') || title.includes('quiz')) return 'Education';
-  if (title.includes('finance') || title.includes('banking') || title.includes('payment') || title.includes('trading')) return 'Finance';
-  if (title.includes('game') || title.includes('vr') || title.includes('ar') || title.includes('3d')) return 'Gaming/VR';
-  
-  return 'General';
+  return match ? match.domain : 'General';
 }
 
 // Helper function to create similarity clusters summary for AI prompt
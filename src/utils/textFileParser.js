@@ -14,22 +14,25 @@
  * - Multiple instructors in any format (auto-split enabled)
  */
 
+// Title keywords to split on, with and without the trailing period (lowercase)
+const TITLE_KEYWORDS = new Set(['dr', 'prof', 'mr', 'ms', 'mrs'].flatMap(keyword => [keyword, `${keyword}.`]));
+
 /**
- * Extract projects for a specific instructor from Excel data
- * @param {string} instructorName - Name of the instructor
- * @param {Array} excelData - Array of project data from Excel
- * @returns {Array} Array of project titles for the instructor
+ * Check whether a word is a title keyword (Dr, Prof, Mr, Ms, Mrs), case-insensitive
+ * @param {string} word - Single word from the instructor text
+ * @returns {boolean} True if the word is a title keyword
  */
-function extractProjectsForInstructor(instructorName, excelData) {
-  if (!excelData || !Array.isArray(excelData)) {
-    console.warn('Invalid Excel data provided to extractProjectsForInstructor');
-    return [];
-  }
-
-  const projects = [];
-  const normalizedInstructorName = normalizeInstructorName(instructorName);
+function isTitleKeyword(word) {
+  return TITLE_KEYWORDS.has(word.toLowerCase());
+}
 
-  console.log(`Looking for instructor: "${instructorName}" (normalized: "${normalizedInstructorName}")`);
+/**
+ * Build a lookup of normalized supervisor name to project titles in one pass
+ * @param {Array} excelData - Array of project data from Excel
+ * @returns {Map} Map of normalized supervisor name to project titles
+ */
+function buildSupervisorProjectIndex(excelData) {
+  const supervisorIndex = new Map();
 
   excelData.forEach((row, index) => {
     // Get supervisor columns with case-insensitive fallback
@@ -45,12 +48,37 @@ function extractProjectsForInstructor(instructorName, excelData) {
       console.log('Sample supervisor:', supervisor);
     }
 
-    if (projectTitle && normalizedSupervisor === normalizedInstructorName) {
-      projects.push(projectTitle);
-      console.log(`Found project "${projectTitle}" for instructor "${instructorName}"`);
+    if (projectTitle) {
+      if (!supervisorIndex.has(normalizedSupervisor)) {
+        supervisorIndex.set(normalizedSupervisor, []);
+      }
+      supervisorIndex.get(normalizedSupervisor).push(projectTitle);
     }
   });
 
+  return supervisorIndex;
+}
+
+/**
+ * Extract projects for a specific instructor from Excel data
+ * @param {string} instructorName - Name of the instructor
+ * @param {Array} excelData - Array of project data from Excel
+ * @param {Map} [supervisorIndex] - Prebuilt index from buildSupervisorProjectIndex
+ * @returns {Array} Array of project titles for the instructor
+ */
+function extractProjectsForInstructor(instructorName, excelData, supervisorIndex = null) {
+  if (!excelData || !Array.isArray(excelData)) {
+    console.warn('Invalid Excel data provided to extractProjectsForInstructor');
+    return [];
+  }
+
+  const index = supervisorIndex || buildSupervisorProjectIndex(excelData);
+  const normalizedInstructorName = normalizeInstructorName(instructorName);
+
+  console.log(`Looking for instructor: "${instructorName}" (normalized: "${normalizedInstructorName}")`);
+
+  const projects = index.get(normalizedInstructorName) || [];
+
   console.log(`Found ${projects.length} projects for "${instructorName}":`, projects);
   return [...new Set(projects)]; // Remove duplicates
 }
@@ -170,9 +198,6 @@ function formatInstructorName(name) {
 function autoSplitInstructorNames(textContent) {
   if (!textContent || typeof textContent !== 'string') return [];
   
-  // Define title keywords to split on (case-insensitive)
-  const titleKeywords = ['dr', 'prof', 'mr', 'ms', 'mrs'];
-  
   // Split content into lines first
   const lines = textContent.split('\n').filter(line => line.trim());
   const extractedNames = [];
@@ -202,9 +227,7 @@ function autoSplitInstructorNames(textContent) {
       const nextNextWord = words[i + 2];
       
       // Check if current word is a title keyword
-      const isTitle = titleKeywords.some(keyword => 
-        word.toLowerCase() === keyword || word.toLowerCase() === keyword + '.'
-      );
+      const isTitle = isTitleKeyword(word);
       
       if (isTitle && nextWord && nextNextWord) {
         // We found a title with at least 2 following words
@@ -222,9 +245,7 @@ function autoSplitInstructorNames(textContent) {
         
         // Look for additional words that might be part of this name
         let j = i + 3;
-        while (j < words.length && !titleKeywords.some(keyword => 
-          words[j].toLowerCase() === keyword || words[j].toLowerCase() === keyword + '.'
-        )) {
+        while (j < words.length && !isTitleKeyword(words[j])) {
           currentName += ` ${words[j]}`;
           j++;
         }
@@ -240,9 +261,7 @@ function autoSplitInstructorNames(textContent) {
         
         // Look for additional words
         let j = i + 2;
-        while (j < words.length && !titleKeywords.some(keyword => 
-          words[j].toLowerCase() === keyword || words[j].toLowerCase() === keyword + '.'
-        )) {
+        while (j < words.length && !isTitleKeyword(words[j])) {
           currentName += ` ${words[j]}`;
           j++;
         }
@@ -308,6 +327,9 @@ export function parseInstructorProjectFile(textContent, excelData = null) {
   let lineNumber = 0;
   const errors = [];
 
+  // Index supervisors once instead of rescanning the Excel rows per instructor
+  const supervisorIndex = buildSupervisorProjectIndex(excelData);
+
   for (const extractedName of extractedNames) {
     lineNumber++;
     const trimmedName = extractedName.trim();
@@ -352,7 +374,7 @@ export function parseInstructorProjectFile(textContent, excelData = null) {
       }
       
       // Extract projects for this instructor from Excel data
-      const instructorProjects = extractProjectsForInstructor(formattedInstructorName, excelData);
+      const instructorProjects = extractProjectsForInstructor(formattedInstructorName, excelData, supervisorIndex);
       
       if (instructorProjects.length > 0) {
         // Instructor is a supervisor with projects
@@ -646,16 +668,25 @@ Prof. Mark Davis
   window.URL.revokeObjectURL(url);
 }
 
+// Statistics per Excel dataset. Parsed uploads are reused by identity, so the
+// panel screen remounting with the same data skips the recomputation; entries
+// go away with their dataset.
+const supervisorStatisticsCache = new WeakMap();
+
 /**
  * Extract supervisor statistics from Excel data
  * @param {Array} excelData - Array of project data from Excel
- * @returns {Object} Supervisor statistics
+ * @returns {Object} Supervisor statistics (shared per dataset, treat as read-only)
  */
 export function extractSupervisorStatistics(excelData) {
   if (!excelData || !Array.isArray(excelData)) {
     return { supervisors: [], totalProjects: 0 };
   }
 
+  if (supervisorStatisticsCache.has(excelData)) {
+    return supervisorStatisticsCache.get(excelData);
+  }
+
   const supervisorMap = new Map();
 
   excelData.forEach((row, index) => {
@@ -697,13 +728,16 @@ export function extractSupervisorStatistics(excelData) {
     projects: supervisor.projects.map(p => p.title) // Simplify for basic display
   }));
 
-  return {
+  const statistics = {
     supervisors: supervisors.sort((a, b) => b.projectCount - a.projectCount),
     totalProjects: excelData.length,
     totalSupervisors: supervisors.length,
     averageProjectsPerSupervisor: supervisors.length > 0 ? (supervisors.reduce((sum, s) => sum + s.projectCount, 0) / supervisors.length) : 0,
     detailedData: Array.from(supervisorMap.values()) // Keep detailed data for Excel export
   };
+
+  supervisorStatisticsCache.set(excelData, statistics);
+  return statistics;
 }
 
 /**
@@ -1,29 +1,33 @@
-import { removeStopwords, eng } from 'stopword';
+import { eng } from 'stopword';
+
+// Minimum cosine similarity for two projects to be reported as similar
+export const SIMILARITY_THRESHOLD = 0.3;
+
+// TF-IDF settings used for project similarity analysis
+export const TFIDF_OPTIONS = { maxFeatures: 1000, minDf: 1, maxDf: 0.95 };
+
+// Nearest TF-IDF neighbours per project sent for AI similarity analysis
+export const SIMILARITY_CANDIDATES_PER_PROJECT = 5;
+
+// English stopwords as a Set for constant-time membership tests
+const STOPWORDS = new Set(eng);
 
 // Simple tokenizer implementation
 function tokenize(text) {
   if (!text || typeof text !== 'string') return [];
   
-  // Convert to lowercase, remove punctuation, and split by whitespace
-  return text
-    .toLowerCase()
-    .replace(/[^\w\s]/g, ' ')
-    .split(/\s+/)
-    .filter(token => token.length > 0);
-}
-
-// Generate n-grams
-function generateNGrams(tokens, n) {
-  const ngrams = [];
-  for (let i = 0; i <= tokens.length - n; i++) {
-    ngrams.push(tokens.slice(i, i + n));
-  }
-  return ngrams;
+  // Convert to lowercase and take the runs of word characters between
+  // punctuation and whitespace
+  return text.toLowerCase().match(/\w+/g) || [];
 }
 
 // Generate bigrams
 function generateBigrams(tokens) {
-  return generateNGrams(tokens, 2).map(bigram => bigram.join('_'));
+  const bigrams = [];
+  for (let i = 0; i < tokens.length - 1; i++) {
+    bigrams.push(`${tokens[i]}_${tokens[i + 1]}`);
+  }
+  return bigrams;
 }
 
 // TF-IDF Vectorizer implementation
@@ -34,35 +38,39 @@ export class TFIDFVectorizer {
     this.maxDf = options.maxDf || 0.95;
     this.vocabulary = new Map();
     this.idf = new Map();
-    this.documents = [];
   }
 
   // Preprocess text
   preprocess(text) {
-    if (!text || typeof text !== 'string') return [];
-    
-    // Tokenize
+    // Tokenize (non-string input yields no tokens)
     const tokens = tokenize(text);
     
-    // Remove stopwords and filter valid words
-    const filteredTokens = removeStopwords(tokens, eng)
-      .filter(token => token.length > 2 && /^[a-z]+$/.test(token));
+    // Remove stopwords and filter valid words in a single pass
+    const filteredTokens = [];
+    for (const token of tokens) {
+      if (token.length > 2 && !STOPWORDS.has(token) && /^[a-z]+$/.test(token)) {
+        filteredTokens.push(token);
+      }
+    }
     
     // Add bigrams
-    const bigrams = generateBigrams(filteredTokens);
-    
-    return [...filteredTokens, ...bigrams];
+    return filteredTokens.concat(generateBigrams(filteredTokens));
   }
 
   // Build vocabulary from documents
   fit(documents) {
-    this.documents = documents.map(doc => this.preprocess(doc));
-    const docCount = this.documents.length;
+    this.fitTokens(documents.map(doc => this.preprocess(doc)));
+  }
+
+  // Build vocabulary from already preprocessed documents. Token lists are
+  // only read here, not kept on the vectorizer.
+  fitTokens(processedDocs) {
+    const docCount = processedDocs.length;
     const termDocCount = new Map();
     const termTotalCount = new Map();
 
     // Count term frequencies across documents
-    this.documents.forEach(doc => {
+    processedDocs.forEach(doc => {
       const uniqueTerms = new Set(doc);
       doc.forEach(term => {
         termTotalCount.set(term, (termTotalCount.get(term) || 0) + 1);
@@ -73,10 +81,11 @@ export class TFIDFVectorizer {
     });
 
     // Filter terms by document frequency
+    const { minDf, maxDf } = this;
     const validTerms = Array.from(termDocCount.entries())
       .filter(([term, count]) => {
         const df = count / docCount;
-        return count >= this.minDf && df <= this.maxDf;
+        return count >= minDf && df <= maxDf;
       })
       .sort((a, b) => termTotalCount.get(b[0]) - termTotalCount.get(a[0]))
       .slice(0, this.maxFeatures)
@@ -90,70 +99,203 @@ export class TFIDFVectorizer {
     });
   }
 
-  // Transform documents to TF-IDF vectors
-  transform(documents) {
-    const processedDocs = documents.map(doc => this.preprocess(doc));
-    const vectors = [];
+  // Transform already preprocessed documents to sparse TF-IDF vectors. Each
+  // vector holds the vocabulary indices of its non-zero terms (ascending) and
+  // their unit-normalized weights, so a dot product between two vectors is
+  // their cosine similarity.
+  transformTokensSparse(processedDocs) {
+    const { vocabulary, idf } = this;
 
-    processedDocs.forEach(doc => {
-      const vector = new Array(this.vocabulary.size).fill(0);
+    return processedDocs.map(doc => {
       const termFreq = new Map();
 
       // Calculate term frequencies
       doc.forEach(term => {
-        if (this.vocabulary.has(term)) {
+        if (vocabulary.has(term)) {
           termFreq.set(term, (termFreq.get(term) || 0) + 1);
         }
       });
 
-      // Calculate TF-IDF
-      termFreq.forEach((tf, term) => {
-        const index = this.vocabulary.get(term);
-        const idf = this.idf.get(term);
-        vector[index] = tf * idf;
+      // Calculate TF-IDF for the non-zero terms only
+      const entries = Array.from(termFreq, ([term, tf]) => [vocabulary.get(term), tf * idf.get(term)])
+        .sort((a, b) => a[0] - b[0]);
+
+      const indices = new Uint32Array(entries.length);
+      const values = new Float64Array(entries.length);
+      let sumSquares = 0;
+      entries.forEach(([index, weight], k) => {
+        indices[k] = index;
+        values[k] = weight;
+        sumSquares += weight * weight;
       });
 
       // Normalize vector
-      const norm = Math.sqrt(vector.reduce((sum, val) => sum + val * val, 0));
+      const norm = Math.sqrt(sumSquares);
       if (norm > 0) {
-        for (let i = 0; i < vector.length; i++) {
-          vector[i] /= norm;
+        for (let k = 0; k < values.length; k++) {
+          values[k] /= norm;
         }
       }
 
-      vectors.push(vector);
+      return { indices, values };
     });
+  }
 
-    return vectors;
+  // Fit and transform to sparse vectors in one step, preprocessing each
+  // document once
+  fitTransformSparse(documents) {
+    const processedDocs = documents.map(doc => this.preprocess(doc));
+    this.fitTokens(processedDocs);
+    return this.transformTokensSparse(processedDocs);
   }
+}
+
+// Visit every document pair (i < j) that shares at least one term, with its
+// similarity score, in ascending (i, j) order. Takes the unit-length sparse
+// vectors from fitTransformSparse, so the dot product is the cosine similarity.
+// Dot products are accumulated through an inverted index (term -> documents
+// containing it), which never materializes the N×N matrix.
+function forEachScoredPair(vectors, visit) {
+  // Inverted index in compressed column form: the postings of term t are
+  // postingDocs/postingWeights[postingStart[t] .. postingStart[t + 1]), in
+  // document order. Packed typed arrays keep the index compact and
+  // cache-friendly however many documents there are.
+  let termCount = 0;
+  vectors.forEach(({ indices }) => {
+    if (indices.length > 0) {
+      termCount = Math.max(termCount, indices[indices.length - 1] + 1);
+    }
+  });
 
-  // Fit and transform in one step
-  fitTransform(documents) {
-    this.fit(documents);
-    return this.transform(documents);
+  const postingStart = new Int32Array(termCount + 1);
+  vectors.forEach(({ indices }) => {
+    for (let k = 0; k < indices.length; k++) {
+      postingStart[indices[k] + 1]++;
+    }
+  });
+  for (let t = 0; t < termCount; t++) {
+    postingStart[t + 1] += postingStart[t];
   }
+
+  const postingDocs = new Int32Array(postingStart[termCount]);
+  const postingWeights = new Float64Array(postingStart[termCount]);
+  const fillPosition = postingStart.slice(0, termCount);
+  vectors.forEach(({ indices, values }, docIndex) => {
+    for (let k = 0; k < indices.length; k++) {
+      const p = fillPosition[indices[k]]++;
+      postingDocs[p] = docIndex;
+      postingWeights[p] = values[k];
+    }
+  });
+
+  // Scores for one row of the similarity matrix at a time, so memory stays
+  // O(N) instead of O(N²)
+  const scores = new Float64Array(vectors.length);
+  const touched = [];
+
+  vectors.forEach(({ indices, values }, i) => {
+    for (let k = 0; k < indices.length; k++) {
+      const weight = values[k];
+      const start = postingStart[indices[k]];
+      // Postings are in document order, so skip straight past j <= i
+      for (let p = postingStart[indices[k] + 1] - 1; p >= start && postingDocs[p] > i; p--) {
+        const j = postingDocs[p];
+        if (scores[j] === 0) touched.push(j);
+        scores[j] += weight * postingWeights[p];
+      }
+    }
+
+    touched.sort((a, b) => a - b);
+    touched.forEach(j => {
+      visit(i, j, scores[j]);
+      scores[j] = 0;
+    });
+    touched.length = 0;
+  });
 }
 
-// Calculate cosine similarity between two vectors
-export function cosineSimilarity(vectorA, vectorB) {
-  if (vectorA.length !== vectorB.length) return 0;
+// Find all document pairs whose similarity exceeds the threshold.
+// Returns only the surviving (i < j) pairs so callers build result records
+// for a small fraction of the N² comparisons. Pairs come back in columnar
+// form - index1[k], index2[k] and scores[k] for k < count - in typed arrays
+// rather than one object per pair.
+export function findSimilarPairs(vectors, threshold = SIMILARITY_THRESHOLD) {
+  let capacity = 256;
+  let index1 = new Int32Array(capacity);
+  let index2 = new Int32Array(capacity);
+  let scores = new Float64Array(capacity);
+  let count = 0;
+
+  forEachScoredPair(vectors, (i, j, score) => {
+    if (score <= threshold) return;
+
+    // Double the columns when full
+    if (count === capacity) {
+      capacity *= 2;
+      const grownIndex1 = new Int32Array(capacity);
+      const grownIndex2 = new Int32Array(capacity);
+      const grownScores = new Float64Array(capacity);
+      grownIndex1.set(index1);
+      grownIndex2.set(index2);
+      grownScores.set(scores);
+      index1 = grownIndex1;
+      index2 = grownIndex2;
+      scores = grownScores;
+    }
 
-  let dotProduct = 0;
-  let normA = 0;
-  let normB = 0;
+    index1[count] = i;
+    index2[count] = j;
+    scores[count] = score;
+    count++;
+  });
 
-  for (let i = 0; i < vectorA.length; i++) {
-    dotProduct += vectorA[i] * vectorB[i];
-    normA += vectorA[i] * vectorA[i];
-    normB += vectorB[i] * vectorB[i];
+  return {
+    count,
+    index1: index1.slice(0, count),
+    index2: index2.slice(0, count),
+    scores: scores.slice(0, count)
+  };
+}
+
+// Keep a list of at most k entries sorted by descending score
+function insertTopScore(list, k, entry) {
+  if (list.length === k) {
+    if (entry.score <= list[k - 1].score) return;
+    list.pop();
   }
 
-  normA = Math.sqrt(normA);
-  normB = Math.sqrt(normB);
+  let position = list.length;
+  while (position > 0 && list[position - 1].score < entry.score) {
+    position--;
+  }
+  list.splice(position, 0, entry);
+}
 
-  if (normA === 0 || normB === 0) return 0;
+// Pair every document with its k most similar documents by TF-IDF score.
+// Used to limit expensive pairwise comparisons (e.g. AI similarity analysis)
+// to likely matches instead of all N² pairs. Each pair is returned once
+// (i < j), most similar first.
+export function findCandidatePairs(vectors, k = SIMILARITY_CANDIDATES_PER_PROJECT) {
+  const neighbours = vectors.map(() => []);
 
-  return dotProduct / (normA * normB);
+  forEachScoredPair(vectors, (i, j, score) => {
+    insertTopScore(neighbours[i], k, { index: j, score });
+    insertTopScore(neighbours[j], k, { index: i, score });
+  });
+
+  const candidates = new Map();
+  neighbours.forEach((list, i) => {
+    list.forEach(({ index, score }) => {
+      const index1 = Math.min(i, index);
+      const index2 = Math.max(i, index);
+      const key = index1 * vectors.length + index2;
+      if (!candidates.has(key)) {
+        candidates.set(key, { index1, index2, score });
+      }
+    });
+  });
+
+  return Array.from(candidates.values()).sort((a, b) => b.score - a.score);
 }
 
 // Domain keywords for categorization
@@ -225,21 +367,105 @@ export const DOMAIN_KEYWORDS = {
   ]
 };
 
+// Check for a regex word character ([A-Za-z0-9_]) by char code
+function isWordChar(code) {
+  return (code >= 97 && code <= 122) || (code >= 65 && code <= 90) ||
+    (code >= 48 && code <= 57) || code === 95;
+}
+
+// Build an Aho-Corasick automaton over the keywords so one pass over a text
+// finds every occurrence of every keyword, including overlapping ones such as
+// 'learning' inside 'machine learning'
+function buildKeywordAutomaton(keywords) {
+  const nodes = [{ next: new Map(), fail: 0, outputs: [] }];
+
+  keywords.forEach((keyword, keywordId) => {
+    let node = 0;
+    for (const char of keyword) {
+      let child = nodes[node].next.get(char);
+      if (child === undefined) {
+        child = nodes.length;
+        nodes.push({ next: new Map(), fail: 0, outputs: [] });
+        nodes[node].next.set(char, child);
+      }
+      node = child;
+    }
+    nodes[node].outputs.push(keywordId);
+  });
+
+  // Breadth-first pass to set failure links and inherit their outputs
+  const queue = Array.from(nodes[0].next.values());
+  for (let q = 0; q < queue.length; q++) {
+    const node = queue[q];
+    nodes[node].next.forEach((child, char) => {
+      let fail = nodes[node].fail;
+      while (fail !== 0 && !nodes[fail].next.has(char)) {
+        fail = nodes[fail].fail;
+      }
+      nodes[child].fail = nodes[fail].next.get(char) || 0;
+      nodes[child].outputs.push(...nodes[nodes[child].fail].outputs);
+      queue.push(child);
+    });
+  }
+
+  return nodes;
+}
+
+// Every distinct domain keyword, the automaton over them, and each domain's
+// keywords mapped to their position in that list
+const KEYWORD_LIST = Array.from(new Set(Object.values(DOMAIN_KEYWORDS).flat()));
+const KEYWORD_AUTOMATON = buildKeywordAutomaton(KEYWORD_LIST);
+const DOMAIN_KEYWORD_IDS = Object.entries(DOMAIN_KEYWORDS).map(([domain, keywords]) => ({
+  domain,
+  keywords: keywords.map(keyword => ({ keyword, id: KEYWORD_LIST.indexOf(keyword) }))
+}));
+
+// Count whole-word occurrences of each keyword in a single pass over the text.
+// Matches the previous per-keyword /\bkeyword\b/g counts: occurrences must sit
+// on word boundaries and repeats of the same keyword may not overlap.
+function countKeywordOccurrences(text) {
+  const counts = new Int32Array(KEYWORD_LIST.length);
+  const lastEnd = new Int32Array(KEYWORD_LIST.length).fill(-1);
+  let state = 0;
+
+  for (let pos = 0; pos < text.length; pos++) {
+    const char = text[pos];
+    while (state !== 0 && !KEYWORD_AUTOMATON[state].next.has(char)) {
+      state = KEYWORD_AUTOMATON[state].fail;
+    }
+    state = KEYWORD_AUTOMATON[state].next.get(char) || 0;
+
+    const outputs = KEYWORD_AUTOMATON[state].outputs;
+    if (outputs.length === 0) continue;
+    if (pos + 1 < text.length && isWordChar(text.charCodeAt(pos + 1))) continue;
+
+    outputs.forEach(keywordId => {
+      const start = pos - KEYWORD_LIST[keywordId].length + 1;
+      if (start > 0 && isWordChar(text.charCodeAt(start - 1))) return;
+      if (start <= lastEnd[keywordId]) return;
+      counts[keywordId]++;
+      lastEnd[keywordId] = pos;
+    });
+  }
+
+  return counts;
+}
+
 // Categorize project using keyword matching
 export function categorizeByKeywords(title, scope) {
   const text = `${title} ${scope}`.toLowerCase();
   const matchedDomains = [];
   const confidenceScores = {};
 
-  Object.entries(DOMAIN_KEYWORDS).forEach(([domain, keywords]) => {
+  const keywordCounts = countKeywordOccurrences(text);
+
+  DOMAIN_KEYWORD_IDS.forEach(({ domain, keywords }) => {
     let score = 0;
     const matchedKeywords = [];
 
-    keywords.forEach(keyword => {
-      const regex = new RegExp(`\\b${keyword}\\b`, 'gi');
-      const matches = text.match(regex);
-      if (matches) {
-        score += matches.length;
+    keywords.forEach(({ keyword, id }) => {
+      if (keywordCounts[id] > 0) {
+        score += keywordCounts[id];
         matchedKeywords.push(keyword);
       }
     });
@@ -263,51 +489,121 @@ export function categorizeByKeywords(title, scope) {
   };
 }
 
-// Generate detailed similarity explanation with specific reasons
+// Keyword groups used to explain why two projects are similar, each compiled
+// once into a case-insensitive whole-word pattern
+function compileKeywordPatterns(keywords) {
+  return keywords.map(keyword => ({ keyword, regex: new RegExp(`\\b${keyword}\\b`, 'i') }));
+}
+
+// Keywords from the group that appear in both profiled texts, in group order
+function findSharedKeywords(patterns, profile1, profile2) {
+  const hits1 = profile1.keywordHits.get(patterns);
+  const hits2 = profile2.keywordHits.get(patterns);
+  return patterns
+    .filter((pattern, k) => hits1[k] && hits2[k])
+    .map(({ keyword }) => keyword);
+}
+
+// Technical keywords and technologies
+const TECHNOLOGY_PATTERNS = compileKeywordPatterns([
+  // Programming Languages & Frameworks
+  'python', 'javascript', 'java', 'react', 'nodejs', 'django', 'flask', 'angular', 'vue',
+  'php', 'laravel', 'spring', 'html', 'css', 'bootstrap', 'flutter', 'kotlin', 'swift',
+  
+  // AI/ML Technologies
+  'tensorflow', 'pytorch', 'scikit-learn', 'opencv', 'pandas', 'numpy', 'matplotlib',
+  'machine learning', 'deep learning', 'neural network', 'nlp', 'computer vision',
+  'recommendation system', 'classification', 'clustering', 'prediction',
+  
+  // Databases & Cloud
+  'mysql', 'postgresql', 'mongodb', 'firebase', 'aws', 'azure', 'docker', 'kubernetes',
+  
+  // IoT & Hardware
+  'arduino', 'raspberry pi', 'sensor', 'bluetooth', 'wifi', 'rfid', 'microcontroller',
+  
+  // Development Concepts
+  'api', 'rest', 'graphql', 'microservices', 'authentication', 'encryption', 'blockchain',
+  'mobile app', 'web app', 'dashboard', 'admin panel', 'user interface'
+]);
+
+// Functional features
+const FEATURE_PATTERNS = compileKeywordPatterns([
+  'authentication', 'login', 'registration', 'dashboard', 'admin', 'user management',
+  'notification', 'alert', 'real-time', 'monitoring', 'analytics', 'reporting',
+  'search', 'filter', 'recommendation', 'payment', 'cart', 'checkout',
+  'chat', 'messaging', 'communication', 'social', 'sharing', 'feedback',
+  'security', 'encryption', 'backup', 'data protection', 'privacy'
+]);
+
+// Methodological approaches
+const METHODOLOGY_PATTERNS = compileKeywordPatterns([
+  'agile', 'waterfall', 'prototype', 'testing', 'deployment', 'development',
+  'design', 'implementation', 'analysis', 'research', 'survey', 'interview',
+  'evaluation', 'validation', 'optimization', 'integration', 'automation'
+]);
+
+// Problem domains or application areas
+const APPLICATION_AREA_PATTERNS = compileKeywordPatterns([
+  'healthcare', 'education', 'business', 'ecommerce', 'social media', 'gaming',
+  'finance', 'banking', 'retail', 'transportation', 'logistics', 'manufacturing',
+  'agriculture', 'environment', 'energy', 'smart city', 'smart home'
+]);
+
+// Objectives or goals
+const OBJECTIVE_PATTERNS = compileKeywordPatterns([
+  'improve', 'enhance', 'optimize', 'automate', 'simplify', 'streamline',
+  'reduce cost', 'increase efficiency', 'better user experience', 'accessibility',
+  'scalability', 'performance', 'security', 'reliability', 'usability'
+]);
+
+const EXPLANATION_KEYWORD_GROUPS = [
+  TECHNOLOGY_PATTERNS,
+  FEATURE_PATTERNS,
+  METHODOLOGY_PATTERNS,
+  APPLICATION_AREA_PATTERNS,
+  OBJECTIVE_PATTERNS
+];
+
+// Common words too generic to count as shared terminology
+const GENERIC_COMMON_WORDS = new Set([
+  'that', 'this', 'with', 'from', 'they', 'were', 'been', 'have', 'will', 'would',
+  'using', 'based', 'system', 'project', 'development'
+]);
+
+// Precompute the per-project parts of a similarity explanation, so a project
+// compared against many others is tokenized and keyword-matched once rather
+// than once per pair. Explaining a pair then only intersects two profiles.
+export function createTextProfile(text) {
+  const words = new Set(tokenize(text));
+  const meaningfulWords = [...words].filter(word =>
+    word.length > 3 && !GENERIC_COMMON_WORDS.has(word)
+  );
+
+  // Which keywords of each explanation group occur in this text
+  const keywordHits = new Map(
+    EXPLANATION_KEYWORD_GROUPS.map(patterns => [patterns, patterns.map(({ regex }) => regex.test(text))])
+  );
+
+  return { words, meaningfulWords, keywordHits };
+}
+
+// Generate detailed similarity explanation with specific reasons.
+// text1/text2 may be raw texts or profiles from createTextProfile.
 export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappingDomains, text1, text2) {
   const explanationParts = [];
   const reasons = [];
 
-  // Preprocess texts for analysis
-  const tokens1 = tokenize(text1.toLowerCase());
-  const tokens2 = tokenize(text2.toLowerCase());
-  const words1 = new Set(tokens1);
-  const words2 = new Set(tokens2);
-  const commonWords = [...words1].filter(word => words2.has(word));
+  const profile1 = typeof text1 === 'string' ? createTextProfile(text1) : text1;
+  const profile2 = typeof text2 === 'string' ? createTextProfile(text2) : text2;
 
   // Domain overlap analysis
   if (overlappingDomains.length > 0) {
     const domainStr = overlappingDomains.join(', ');
     reasons.push(`✓ Domain Overlap: Both projects belong to ${domainStr} domain(s)`);
-  }  // Find technical keywords and technologies  
-  const technologyPatterns = [    // Programming Languages & Frameworks
-    'python', 'javascript', 'java', 'react', 'nodejs', 'django', 'flask', 'angular', 'vue',
-    'php', 'laravel', 'spring', 'html', 'css', 'bootstrap', 'flutter', 'kotlin', 'swift',
-    
-    // AI/ML Technologies
-    'tensorflow', 'pytorch', 'scikit-learn', 'opencv', 'pandas', 'numpy', 'matplotlib',
-    'machine learning', 'deep learning', 'neural network', 'nlp', 'computer vision',
-    'recommendation system', 'classification', 'clustering', 'prediction',
-    
-    // Databases & Cloud
-    'mysql', 'postgresql', 'mongodb', 'firebase', 'aws', 'azure', 'docker', 'kubernetes',
-    
-    // IoT & Hardware
-    'arduino', 'raspberry pi', 'sensor', 'bluetooth', 'wifi', 'rfid', 'microcontroller',
-    
-    // Development Concepts
-    'api', 'rest', 'graphql', 'microservices', 'authentication', 'encryption', 'blockchain',
-    'mobile app', 'web app', 'dashboard', 'admin panel', 'user interface'
-  ];
-  
+  }
 
-  const foundTechnologies = [];
-  technologyPatterns.forEach(tech => {
-    const regex = new RegExp(`\\b${tech}\\b`, 'gi');
-    if (text1.match(regex) && text2.match(regex)) {
-      foundTechnologies.push(tech);
-    }
-  });
+  // Find technical keywords and technologies
+  const foundTechnologies = findSharedKeywords(TECHNOLOGY_PATTERNS, profile1, profile2);
 
   if (foundTechnologies.length > 0) {
     const techList = foundTechnologies.slice(0, 5).join(', ');
@@ -315,21 +611,7 @@ export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappi
   }
 
   // Find common functional features
-  const featureKeywords = [
-    'authentication', 'login', 'registration', 'dashboard', 'admin', 'user management',
-    'notification', 'alert', 'real-time', 'monitoring', 'analytics', 'reporting',
-    'search', 'filter', 'recommendation', 'payment', 'cart', 'checkout',
-    'chat', 'messaging', 'communication', 'social', 'sharing', 'feedback',
-    'security', 'encryption', 'backup', 'data protection', 'privacy'
-  ];
-
-  const commonFeatures = [];
-  featureKeywords.forEach(feature => {
-    const regex = new RegExp(`\\b${feature}\\b`, 'gi');
-    if (text1.match(regex) && text2.match(regex)) {
-      commonFeatures.push(feature);
-    }
-  });
+  const commonFeatures = findSharedKeywords(FEATURE_PATTERNS, profile1, profile2);
 
   if (commonFeatures.length > 0) {
     const featureList = commonFeatures.slice(0, 4).join(', ');
@@ -337,19 +619,7 @@ export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappi
   }
 
   // Find common methodological approaches
-  const methodologyKeywords = [
-    'agile', 'waterfall', 'prototype', 'testing', 'deployment', 'development',
-    'design', 'implementation', 'analysis', 'research', 'survey', 'interview',
-    'evaluation', 'validation', 'optimization', 'integration', 'automation'
-  ];
-
-  const commonMethodologies = [];
-  methodologyKeywords.forEach(method => {
-    const regex = new RegExp(`\\b${method}\\b`, 'gi');
-    if (text1.match(regex) && text2.match(regex)) {
-      commonMethodologies.push(method);
-    }
-  });
+  const commonMethodologies = findSharedKeywords(METHODOLOGY_PATTERNS, profile1, profile2);
 
   if (commonMethodologies.length > 0) {
     const methodList = commonMethodologies.slice(0, 3).join(', ');
@@ -357,19 +627,7 @@ export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappi
   }
 
   // Find common problem domains or application areas
-  const applicationAreas = [
-    'healthcare', 'education', 'business', 'ecommerce', 'social media', 'gaming',
-    'finance', 'banking', 'retail', 'transportation', 'logistics', 'manufacturing',
-    'agriculture', 'environment', 'energy', 'smart city', 'smart home'
-  ];
-
-  const commonAreas = [];
-  applicationAreas.forEach(area => {
-    const regex = new RegExp(`\\b${area}\\b`, 'gi');
-    if (text1.match(regex) && text2.match(regex)) {
-      commonAreas.push(area);
-    }
-  });
+  const commonAreas = findSharedKeywords(APPLICATION_AREA_PATTERNS, profile1, profile2);
 
   if (commonAreas.length > 0) {
     const areaList = commonAreas.join(', ');
@@ -377,19 +635,7 @@ export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappi
   }
 
   // Find common objectives or goals
-  const objectiveKeywords = [
-    'improve', 'enhance', 'optimize', 'automate', 'simplify', 'streamline',
-    'reduce cost', 'increase efficiency', 'better user experience', 'accessibility',
-    'scalability', 'performance', 'security', 'reliability', 'usability'
-  ];
-
-  const commonObjectives = [];
-  objectiveKeywords.forEach(objective => {
-    const regex = new RegExp(`\\b${objective}\\b`, 'gi');
-    if (text1.match(regex) && text2.match(regex)) {
-      commonObjectives.push(objective);
-    }
-  });
+  const commonObjectives = findSharedKeywords(OBJECTIVE_PATTERNS, profile1, profile2);
 
   if (commonObjectives.length > 0) {
     const objList = commonObjectives.slice(0, 3).join(', ');
@@ -397,10 +643,7 @@ export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappi
   }
 
   // Analyze text similarity level
-  const meaningfulCommon = commonWords.filter(word => 
-    word.length > 3 && 
-    !['that', 'this', 'with', 'from', 'they', 'were', 'been', 'have', 'will', 'would', 'using', 'based', 'system', 'project', 'development'].includes(word)
-  );
+  const meaningfulCommon = profile1.meaningfulWords.filter(word => profile2.words.has(word));
 
   if (meaningfulCommon.length > 8) {
     reasons.push(`✓ High Textual Overlap: Share ${meaningfulCommon.length} significant common terms`);
@@ -444,10 +687,114 @@ export function generateSimilarityExplanation(proj1Id, proj2Id, score, overlappi
   return explanationParts.join('\n');
 }
 
+// Title keywords for the coarse domains used when balancing panels
+const PANEL_DOMAIN_KEYWORDS = {
+  'AI/ML': [
+    'ai', 'machine learning', 'neural', 'chatbot', 'nlp', 'computer vision',
+    'ml', 'artificial intelligence', 'deep learning'
+  ],
+  'Web Development': [
+    'web', 'website', 'e-commerce', 'platform', 'dashboard', 'portal',
+    'ecommerce', 'cms', 'blog'
+  ],
+  'Mobile Development': [
+    'mobile', 'app', 'android', 'ios', 'flutter', 'react native', 'smartphone', 'tablet'
+  ],
+  'IoT': [
+    'iot', 'sensor', 'automation', 'embedded', 'arduino', 'raspberry pi', 'smart', 'connected'
+  ],
+  'Cybersecurity': [
+    'security', 'cyber', 'encryption', 'blockchain', 'penetration', 'firewall',
+    'vulnerability', 'threat', 'secure'
+  ],
+  'Education': [
+    'education', 'learning', 'teaching', 'student', 'quiz', 'course', 'tutorial', 'exam', 'school'
+  ],
+  'VR/AR': [
+    'vr', 'ar', 'virtual reality', 'augmented reality', '3d', 'metaverse'
+  ],
+  'Game Development': [
+    'game', 'gaming', 'unity', 'graphics', 'animation', 'entertainment'
+  ],
+  'Healthcare': [
+    'health', 'medical', 'hospital', 'patient', 'doctor', 'medicine', 'telemedicine', 'pharmacy'
+  ],
+  'Finance': [
+    'finance', 'banking', 'payment', 'trading', 'investment', 'budget', 'accounting', 'cryptocurrency'
+  ]
+};
+
+// Short keywords that also occur inside unrelated words ('ai' in 'email',
+// 'ar' in 'smart', 'app' in 'approach'); these only match as whole words
+const WHOLE_WORD_DOMAIN_KEYWORDS = new Set(['ai', 'ml', 'ar', 'vr', 'ios', 'app']);
+
+// Compile a keyword list into one pattern. Keywords must start at a word
+// boundary; the short ambiguous ones must also end there (plural 's'
+// allowed), while the rest may run on into compounds and derived forms
+// ('healthcare', 'cybersecurity', 'educational', 'gamers'). Keywords are
+// de-duplicated and tried longest first.
+export function compileDomainPattern(keywords) {
+  const escape = keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+  const unique = Array.from(new Set(keywords)).sort((a, b) => b.length - a.length);
+  const prefixKeywords = unique.filter(keyword => !WHOLE_WORD_DOMAIN_KEYWORDS.has(keyword)).map(escape);
+  const wholeWordKeywords = unique.filter(keyword => WHOLE_WORD_DOMAIN_KEYWORDS.has(keyword)).map(escape);
+
+  const alternatives = [];
+  if (prefixKeywords.length > 0) {
+    alternatives.push(`(?:${prefixKeywords.join('|')})\\w*`);
+  }
+  if (wholeWordKeywords.length > 0) {
+    alternatives.push(`(?:${wholeWordKeywords.join('|')})s?\\b`);
+  }
+  return new RegExp(`\\b(?:${alternatives.join('|')})`);
+}
+
+const PANEL_DOMAIN_PATTERNS = Object.entries(PANEL_DOMAIN_KEYWORDS).map(([domain, keywords]) => ({
+  domain,
+  pattern: compileDomainPattern(keywords)
+}));
+
+// Detected domains per title. Panel allocation asks for the same titles
+// again for every candidate panel, so each title is matched only once.
+const projectDomainCache = new Map();
+
+// Simple domain detection based on keywords in project titles.
+// The returned array is shared between callers and must not be modified.
+export function detectProjectDomains(projectTitle) {
+  if (projectDomainCache.has(projectTitle)) {
+    return projectDomainCache.get(projectTitle);
+  }
+
+  const title = projectTitle.toLowerCase();
+  const domains = PANEL_DOMAIN_PATTERNS
+    .filter(({ pattern }) => pattern.test(title))
+    .map(({ domain }) => domain);
+  
+  // Default to General if no specific domain detected
+  const result = domains.length > 0 ? domains : ['General'];
+  projectDomainCache.set(projectTitle, result);
+  return result;
+}
+
 // Determine similarity level
 export function getSimilarityLevel(score) {
   if (score > 0.7) return 'Very High';
   if (score > 0.5) return 'High';
   if (score > 0.3) return 'Medium';
   return 'Low';
-} 
\ No newline at end of file
+}
+
+// Count distinct domains across categorized projects in a single pass
+export function countUniqueDomains(domainResults) {
+  const uniqueDomains = new Set();
+
+  domainResults.forEach(project => {
+    if (Array.isArray(project.domains)) {
+      project.domains.forEach(domain => uniqueDomains.add(domain));
+    } else {
+      uniqueDomains.add(project.domains);
+    }
+  });
+
+  return uniqueDomains.size;
+}